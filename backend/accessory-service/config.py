@@ -6,33 +6,42 @@ following Azure best practices for credential management.
 """
 
 import os
-from typing import Optional
-from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings and configuration"""
+    """
+    Application settings and configuration
 
-    def __init__(self):
-        # CosmosDB Configuration
-        self.cosmos_endpoint: str = os.getenv("COSMOS_ENDPOINT", "")
-        self.cosmos_key: str = os.getenv("COSMOS_KEY", "")
-        self.cosmos_database_name: str = os.getenv(
-            "COSMOS_DATABASE_NAME", "accessoryservice")
-        self.cosmos_container_name: str = os.getenv(
-            "COSMOS_CONTAINER_NAME", "accessories")
+    Immutable and built once at import time; validation runs in ``__post_init__``,
+    except for checks that only matter to a running service (see ``validate_for_startup``).
+    """
 
-        # Application Configuration
-        self.app_name: str = "Accessory Service API"
-        self.app_version: str = "1.0.0"
-        self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+    # CosmosDB Configuration
+    cosmos_endpoint: str
+    cosmos_key: str = field(default="", repr=False)
+    cosmos_database_name: str = "accessoryservice"
+    cosmos_container_name: str = "accessories"
+    cosmos_preferred_locations: Tuple[str, ...] = ()
+    cosmos_max_throughput: int = 4000
+    cosmos_emulator_disable_ssl_verify: bool = False
 
-        # Determine if running locally (CosmosDB Emulator) or in Azure
-        self.is_local: bool = self._is_local_development()
+    # Application Configuration
+    app_name: str = "Accessory Service API"
+    app_version: str = "1.0.0"
+    debug: bool = False
+
+    # Determine if running locally (CosmosDB Emulator) or in Azure
+    is_local: bool = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "is_local", self._is_local_development())
 
         # Validate required settings
         if not self.cosmos_endpoint:
@@ -44,6 +53,42 @@ class Settings:
             raise ValueError(
                 "COSMOS_KEY environment variable is required for local development")
 
+    def validate_for_startup(self) -> None:
+        """
+        Validate settings only the running service depends on
+
+        Called from the app lifespan, so a bad value fails startup instead of importing
+        this module.
+        """
+        if self.cosmos_max_throughput < 1000:
+            raise ValueError(
+                "COSMOS_MAX_RU must be at least 1000 (autoscale minimum)")
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables (and the optional .env file)"""
+        return cls(
+            cosmos_endpoint=os.getenv("COSMOS_ENDPOINT", ""),
+            cosmos_key=os.getenv("COSMOS_KEY", ""),
+            cosmos_database_name=os.getenv(
+                "COSMOS_DATABASE_NAME", "accessoryservice"),
+            cosmos_container_name=os.getenv(
+                "COSMOS_CONTAINER_NAME", "accessories"),
+            # Comma-separated Azure regions to route requests to first, e.g. "West Europe,North Europe"
+            cosmos_preferred_locations=tuple(
+                region.strip()
+                for region in os.getenv("COSMOS_PREFERRED_LOCATIONS", "").split(",")
+                if region.strip()
+            ),
+            # Autoscale ceiling (RU/s), only used when the service creates the container
+            # itself; the serverless account provisioned by infra/ ignores it
+            cosmos_max_throughput=int(os.getenv("COSMOS_MAX_RU", "4000")),
+            # Dev/emulator only: the emulator serves a self-signed certificate
+            cosmos_emulator_disable_ssl_verify=os.getenv(
+                "COSMOS_EMULATOR_DISABLE_SSL_VERIFY", "0").lower() in ("1", "true", "yes"),
+            debug=os.getenv("DEBUG", "false").lower() == "true",
+        )
+
     def _is_local_development(self) -> bool:
         """
         Detect if running in local development environment
@@ -56,9 +101,9 @@ class Settings:
         return "localhost" in endpoint or "127.0.0.1" in endpoint
 
 
+_settings = Settings.from_env()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings"""
-    return Settings()
\ No newline at end of file
+    """Get application settings"""
+    return _settings
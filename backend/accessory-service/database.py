@@ -10,21 +10,189 @@ Authentication Strategy:
 - Azure Deployment: Uses Entra ID (Managed Identity) authentication
 """
 
+import asyncio
+import json
 import logging
-import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from azure.cosmos import CosmosClient, PartitionKey
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+import orjson
+from azure.cosmos import PartitionKey, ThroughputProperties
 from azure.cosmos import exceptions as cosmos_exceptions
-from azure.identity import DefaultAzureCredential
+from azure.cosmos.aio import CosmosClient
+from azure.cosmos.aio import _asynchronous_request
+from azure.core import MatchConditions
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.identity.aio import DefaultAzureCredential
 
+from config import get_settings
 from models import Accessory, AccessoryCreate, AccessoryUpdate, AccessorySearchFilters
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Only index the properties search_accessories filters or sorts on; every other path
+# is excluded to keep write RU and index storage low. The composite index serves the
+# common "filter by type, newest first" listing. This is applied only when the service
+# creates the container itself (e.g. against the emulator); Azure containers are
+# provisioned by infra/main.bicep, which carries a copy that must be kept in sync.
+ACCESSORY_INDEXING_POLICY: Dict[str, Any] = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [
+        {"path": "/searchText/?"},
+        {"path": "/type/?"},
+        {"path": "/stock/?"},
+        {"path": "/createdAt/?"},
+    ],
+    "excludedPaths": [{"path": "/*"}],
+    "compositeIndexes": [
+        [
+            {"path": "/type", "order": "ascending"},
+            {"path": "/createdAt", "order": "descending"},
+        ]
+    ],
+}
+
+
+def _use_orjson_for_cosmos_responses() -> None:
+    """
+    Decode Cosmos response bodies with orjson instead of the stdlib json module.
+
+    The async SDK parses every response with the ``json.loads`` referenced by its request
+    module; pointing that reference at ``orjson.loads`` speeds up decoding of large query
+    pages. The swap is skipped if a future SDK version no longer exposes it; test_database.py
+    pins both the patched attribute and the SDK version it was written against.
+    """
+    if getattr(_asynchronous_request, "json", None) is json:
+        _asynchronous_request.json = SimpleNamespace(loads=orjson.loads, dumps=json.dumps)
+
+
+_use_orjson_for_cosmos_responses()
+
+# Accessory field names, resolved once. Stored documents always carry every field, so
+# constructed models share one precomputed fields-set instead of building one per item.
+ACCESSORY_FIELDS: Tuple[str, ...] = tuple(Accessory.model_fields)
+ACCESSORY_FIELDS_SET = set(ACCESSORY_FIELDS)
+
+# Project only the API fields so raw query results match the Accessory schema
+# (no searchText or Cosmos system properties) and carry less payload.
+ACCESSORY_PROJECTION = ", ".join(f"c.{field}" for field in ACCESSORY_FIELDS)
+
+
+def _accessory_from_document(document: Dict[str, Any]) -> Accessory:
+    """
+    Build an Accessory from a document this service stored, skipping validation.
+
+    The document was validated when it was written, so only the ISO timestamps are
+    converted back; Cosmos system properties and ``searchText`` are dropped.
+    """
+    values = _accessory_fields(document)
+    for field in ("createdAt", "updatedAt"):
+        if isinstance(values.get(field), str):
+            values[field] = datetime.fromisoformat(values[field])
+    return Accessory.model_construct(_fields_set=ACCESSORY_FIELDS_SET, **values)
+
+
+def _accessory_fields(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the Accessory fields of a stored document."""
+    return {field: document[field] for field in ACCESSORY_FIELDS if field in document}
+
+
+def _build_search_text(accessory_dict: Dict[str, Any]) -> str:
+    """
+    Build the lowercased ``searchText`` field stored with each accessory.
+
+    Keeping name and description in one normalized field lets search use a single
+    ``CONTAINS`` instead of one per property, and makes matching case-insensitive.
+    """
+    name = accessory_dict.get("name") or ""
+    description = accessory_dict.get("description") or ""
+    return f"{name} {description}".lower()
+
+
+# Bounds for the in-process get_accessory cache. Writes in this process refresh or drop
+# their entry; other replicas may serve a stale copy for up to the TTL.
+ACCESSORY_CACHE_MAX_SIZE = 1024
+ACCESSORY_CACHE_TTL_SECONDS = 30.0
+
+# Attempts for an update whose ETag-conditioned patch loses a race with another writer
+UPDATE_CONFLICT_ATTEMPTS = 3
+
+# Bounds for the in-process search result cache, which is cleared on every write
+SEARCH_CACHE_MAX_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 30.0
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after a fixed time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (expiry on the monotonic clock, value)
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or ``None`` when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+@lru_cache(maxsize=64)
+def _search_query_template(
+    has_search: bool, has_type: bool, low_stock_only: bool
+) -> str:
+    """
+    Return the search SQL for a combination of filters.
+
+    Filter values are always bound as parameters, so every request with the same filter
+    shape sends byte-identical query text and Cosmos can reuse its cached query plan.
+    """
+    query_parts = [f"SELECT {ACCESSORY_PROJECTION} FROM c"]
+    conditions: List[str] = []
+
+    if has_search:
+        conditions.append("CONTAINS(c.searchText, @search)")
+    if has_type:
+        conditions.append("c.type = @type")
+    if low_stock_only:
+        conditions.append("c.stock < 10")
+
+    if conditions:
+        query_parts.append("WHERE " + " AND ".join(conditions))
+
+    query_parts.append("ORDER BY c.createdAt DESC")
+    return " ".join(query_parts)
+
 
 class AccessoryCosmosService:
     """Service class for managing accessories in Azure CosmosDB."""
@@ -35,16 +203,39 @@ class AccessoryCosmosService:
         cosmos_key: str,
         database_name: str = "accessoryservice",
         container_name: str = "accessories",
+        preferred_locations: Optional[Sequence[str]] = None,
+        max_throughput: int = 4000,
+        disable_ssl_verify: bool = False,
     ):
         """Initialize the CosmosDB service for accessories."""
         self.cosmos_endpoint = cosmos_endpoint
         self.cosmos_key = cosmos_key
         self.database_name = database_name
         self.container_name = container_name
+        self.preferred_locations = list(preferred_locations or [])
+        self.max_throughput = max_throughput
+        self.disable_ssl_verify = disable_ssl_verify
 
         self.client: Optional[CosmosClient] = None
+        self.credential: Optional[DefaultAzureCredential] = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
         self.database = None
         self.container = None
+        self._initialized = False
+
+        # Serializes database/container provisioning when several requests hit a
+        # missing container at the same time.
+        self._setup_lock = asyncio.Lock()
+        # The empty-container check behind seeding only needs to run once per process
+        self._seed_checked = False
+
+        # accessory id -> Accessory, for point reads
+        self._cache = _TTLCache(ACCESSORY_CACHE_MAX_SIZE, ACCESSORY_CACHE_TTL_SECONDS)
+        # (generation, filter values, token) -> (page, continuation token), for searches.
+        # Writes bump the generation, so a search that raced a write can only cache its
+        # result under a key that is never looked up again.
+        self._search_cache = _TTLCache(SEARCH_CACHE_MAX_SIZE, SEARCH_CACHE_TTL_SECONDS)
+        self._search_generation = 0
 
         logger.info("AccessoryCosmosService initialized with lazy loading")
 
@@ -62,35 +253,57 @@ class AccessoryCosmosService:
 
         options: Dict[str, Any] = {
             "url": self.cosmos_endpoint,
+            # Note: the legacy ``request_timeout`` option is in milliseconds and would
+            # override this value, so only ``connection_timeout`` is set
             "connection_timeout": 30,
-            "request_timeout": 30,
         }
 
+        # One aiohttp session for the lifetime of the service, so sockets are pooled and
+        # kept alive across requests; the service closes it in close(). Idle sockets are
+        # kept for minutes (aiohttp's default is 15 s) so a quiet spell does not force new
+        # TLS handshakes, and DNS lookups of the account endpoint are cached.
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=600,
+                ttl_dns_cache=300,
+            )
+        )
+        options["transport"] = AioHttpTransport(
+            session=self.http_session, session_owner=False)
+
+        if self.preferred_locations:
+            # Route requests to the nearest replica instead of the account's write region
+            options["preferred_locations"] = self.preferred_locations
+
         if is_local:
             # Local development: Use key-based authentication
             logger.info("Using key-based authentication (local development)")
             options["credential"] = self.cosmos_key
 
-            # Check if SSL verification should be disabled (for emulator)
-            disable_ssl_verify = os.getenv(
-                "COSMOS_EMULATOR_DISABLE_SSL_VERIFY", "0").lower() in ("1", "true", "yes")
-
-            if disable_ssl_verify:
+            # SSL verification may be disabled for the emulator's self-signed certificate
+            if self.disable_ssl_verify:
                 options["connection_verify"] = False  # type: ignore[arg-type]
                 logger.warning(
-                    "COSMOS_EMULATOR_DISABLE_SSL_VERIFY is enabled – SSL certificate verification DISABLED (dev/emulator only)"
+                    "COSMOS_EMULATOR_DISABLE_SSL_VERIFY is enabled – SSL certificate "
+                    "verification DISABLED (dev/emulator only)"
                 )
         else:
             # Azure deployment: Use Entra ID (Managed Identity) authentication
             logger.info(
                 "Using Entra ID authentication (Azure deployment with Managed Identity)")
-            credential = DefaultAzureCredential()
-            options["credential"] = credential
+            self.credential = DefaultAzureCredential()
+            options["credential"] = self.credential
 
         return options
 
     def _ensure_initialized(self):
         """Ensure the CosmosDB client, database, and container are initialized."""
+        # Fast path once startup() (or an earlier call) has built the clients
+        if self._initialized:
+            return
+
         if self.client is None:
             logger.info("Initializing CosmosDB client...")
             cosmos_client_options = self._build_cosmos_client_options()
@@ -101,29 +314,47 @@ class AccessoryCosmosService:
             self.client = CosmosClient(**cosmos_client_options)
 
         if self.database is None:
-            logger.info(f"Getting database: {self.database_name}")
+            logger.info("Getting database: %s", self.database_name)
             self.database = self.client.get_database_client(self.database_name)
 
         if self.container is None:
-            logger.info(f"Getting container: {self.container_name}")
+            logger.info("Getting container: %s", self.container_name)
             self.container = self.database.get_container_client(
                 self.container_name)
 
+        self._initialized = True
+
+    async def startup(self) -> Dict[str, Any]:
+        """
+        Initialize the service once before it serves traffic.
+
+        Builds the client, database and container proxies, then runs the health check,
+        whose container read warms the SDK's endpoint and partition-key-range caches.
+        Building the proxies makes no network calls, so later operations find them in
+        place even when Cosmos DB is unreachable at startup.
+        """
+        self._ensure_initialized()
+        return await self.health_check()
+
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check and auto-create database/container if needed."""
         try:
             self._ensure_initialized()
 
             try:
-                items = list(
-                    self.container.query_items(
-                        query="SELECT TOP 1 c.id FROM c",
-                        enable_cross_partition_query=True,
-                        max_item_count=1,
-                    )
-                )
+                # Metadata read: one request, no query fan-out across partitions
+                await self.container.read()
+                if self._seed_checked:
+                    return {"status": "healthy", "database": self.database_name}
+
+                # Stop at the first result instead of draining the iterator into a list
+                first_item = await anext(aiter(self.container.query_items(
+                    query="SELECT TOP 1 c.id FROM c",
+                    max_item_count=1,
+                )), None)
+                self._seed_checked = True
 
-                if items:
+                if first_item is not None:
                     return {"status": "healthy", "database": self.database_name}
 
                 logger.info(
@@ -134,51 +365,62 @@ class AccessoryCosmosService:
                     "database": self.database_name,
                     "message": "Database was empty and has been seeded with sample data",
                 }
-            except (cosmos_exceptions.CosmosResourceNotFoundError, cosmos_exceptions.CosmosHttpResponseError) as e:
-                error_message = str(e).lower()
-                if "does not exist" in error_message or "notfound" in error_message or (
-                    hasattr(e, "status_code") and e.status_code in [404, 500]
-                ):
-                    logger.info(
-                        "Database or container not found. Creating and seeding with sample data...")
-                    result = await self._create_database_and_seed()
-                    if result["status"] == "healthy":
-                        return {
-                            "status": "healthy",
-                            "database": self.database_name,
-                            "message": "Database and container created successfully with sample data",
-                        }
-                    return result
+            except cosmos_exceptions.CosmosResourceNotFoundError:
+                # 404: the database or container does not exist yet
+                logger.info(
+                    "Database or container not found. Creating and seeding with sample data...")
+                result = await self._create_database_and_seed()
+                if result["status"] == "healthy":
+                    return {
+                        "status": "healthy",
+                        "database": self.database_name,
+                        "message": "Database and container created successfully with sample data",
+                    }
+                return result
+            except cosmos_exceptions.CosmosHttpResponseError as e:
+                if e.status_code in (401, 403):
+                    # Wrong key or missing RBAC role: provisioning would fail the same way
+                    logger.error(
+                        "CosmosDB rejected the credentials (HTTP %s)", e.status_code)
+                    return {
+                        "status": "unhealthy",
+                        "error": f"CosmosDB authorization failed (HTTP {e.status_code})",
+                    }
                 raise
 
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return {"status": "unhealthy", "error": str(e)}
 
     async def _create_database_and_seed(self) -> Dict[str, Any]:
         """Create database, container, and seed with sample accessory data."""
-        try:
-            logger.info(f"Creating database: {self.database_name}")
-            database = self.client.create_database_if_not_exists(
-                id=self.database_name)
-
-            logger.info(f"Creating container: {self.container_name}")
-            database.create_container_if_not_exists(
-                id=self.container_name,
-                partition_key=PartitionKey(path="/id"),
-                offer_throughput=400,
-            )
-
-            self.database = self.client.get_database_client(self.database_name)
-            self.container = self.database.get_container_client(
-                self.container_name)
+        async with self._setup_lock:
+            try:
+                logger.info("Creating database: %s", self.database_name)
+                self.database = await self.client.create_database_if_not_exists(
+                    id=self.database_name)
+
+                logger.info("Creating container: %s", self.container_name)
+                self.container = await self.database.create_container_if_not_exists(
+                    id=self.container_name,
+                    partition_key=PartitionKey(path="/type"),
+                    indexing_policy=ACCESSORY_INDEXING_POLICY,
+                    # Autoscale between 10% and 100% of max RU/s instead of throttling
+                    # bursts against a fixed 400 RU/s. This only applies to a container
+                    # the service creates itself (e.g. on the emulator or a provisioned-
+                    # throughput account); the Azure deployment's serverless account
+                    # has no throughput settings, and existing containers are unchanged.
+                    offer_throughput=ThroughputProperties(
+                        auto_scale_max_throughput=self.max_throughput),
+                )
 
-            await self._database_seed()
-            logger.info("Database setup and seeding completed successfully")
-            return {"status": "healthy", "message": "Database and container created successfully with sample data"}
-        except Exception as e:
-            logger.error(f"Failed to create database and seed data: {e}")
-            return {"status": "unhealthy", "error": f"Failed to create database: {e}"}
+                await self._database_seed()
+                self._seed_checked = True
+                logger.info("Database setup and seeding completed successfully")
+                return {"status": "healthy", "message": "Database and container created successfully with sample data"}
+            except Exception as e:
+                logger.error("Failed to create database and seed data: %s", e)
+                return {"status": "unhealthy", "error": f"Failed to create database: {e}"}
 
     async def _database_seed(self) -> None:
         """Seed the existing CosmosDB container with sample accessory data."""
@@ -187,6 +429,7 @@ class AccessoryCosmosService:
                 "Cosmos container is not initialized; cannot seed database")
 
         logger.info("Seeding container with sample accessory data")
+        now_iso = datetime.now(timezone.utc).isoformat()
         sample_accessories = [
             {
                 "id": "x1",
@@ -197,8 +440,8 @@ class AccessoryCosmosService:
                 "size": "M",
                 "imageUrl": "",
                 "description": "Durable rope",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat(),
+                "createdAt": now_iso,
+                "updatedAt": now_iso,
             },
             {
                 "id": "x2",
@@ -209,205 +452,454 @@ class AccessoryCosmosService:
                 "size": "S",
                 "imageUrl": "",
                 "description": "Soft chews",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat(),
+                "createdAt": now_iso,
+                "updatedAt": now_iso,
             },
         ]
 
+        # Transactional batches are scoped to one partition, so group seeds by type
+        accessories_by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for accessory_data in sample_accessories:
-            try:
-                self.container.create_item(body=accessory_data)
-                logger.info(
-                    f"Seeded accessory: {accessory_data['name']} ({accessory_data['id']})")
-            except cosmos_exceptions.CosmosResourceExistsError:
-                logger.info(
-                    f"Accessory {accessory_data['name']} ({accessory_data['id']}) already exists, skipping")
-                continue
+            accessory_data["searchText"] = _build_search_text(accessory_data)
+            accessories_by_type[accessory_data["type"]].append(accessory_data)
+
+        # Partitions are independent, so their batches are submitted concurrently
+        await asyncio.gather(*(
+            self._seed_partition(accessory_type, accessories)
+            for accessory_type, accessories in accessories_by_type.items()
+        ))
+        self._invalidate_searches()
+
+    async def _seed_partition(
+        self, accessory_type: str, accessories: List[Dict[str, Any]]
+    ) -> None:
+        """Seed the accessories of one type as a single transactional batch."""
+        try:
+            await self.container.execute_item_batch(
+                batch_operations=[("create", (accessory_data,)) for accessory_data in accessories],
+                partition_key=accessory_type,
+            )
+            logger.info(
+                "Seeded %s accessories of type %s", len(accessories), accessory_type)
+        except cosmos_exceptions.CosmosBatchOperationError:
+            # The batch is all-or-nothing; retry item by item to skip existing ones
+            results = await asyncio.gather(
+                *(self.container.create_item(body=accessory_data)
+                  for accessory_data in accessories),
+                return_exceptions=True,
+            )
+            for accessory_data, result in zip(accessories, results):
+                if isinstance(result, cosmos_exceptions.CosmosResourceExistsError):
+                    logger.info(
+                        "Accessory %s (%s) already exists, skipping",
+                        accessory_data['name'], accessory_data['id'])
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    logger.info(
+                        "Seeded accessory: %s (%s)", accessory_data['name'], accessory_data['id'])
 
-    def create_accessory(self, accessory_data: AccessoryCreate) -> Accessory:
+    async def create_accessory(self, accessory_data: AccessoryCreate) -> Accessory:
         """Create a new accessory in CosmosDB."""
         try:
             self._ensure_initialized()
 
+            now = datetime.now(timezone.utc)
             accessory = Accessory(
                 **accessory_data.model_dump(),
-                createdAt=datetime.utcnow(),
-                updatedAt=datetime.utcnow(),
+                createdAt=now,
+                updatedAt=now,
             )
-            accessory_dict = accessory.model_dump(mode="json")
-
-            response = self.container.create_item(body=accessory_dict)
-            logger.info(f"Created accessory: {response['id']}")
-
-            return Accessory(**response)
+            # Only the timestamps need converting for the SDK's JSON encoder
+            accessory_dict = accessory.model_dump()
+            accessory_dict["createdAt"] = accessory_dict["updatedAt"] = now.isoformat()
+            accessory_dict["searchText"] = _build_search_text(accessory_dict)
+
+            response = await self.container.create_item(body=accessory_dict)
+            logger.info("Created accessory: %s", response['id'])
+
+            created = _accessory_from_document(response)
+            # New items are usually read back right away (e.g. detail page after create)
+            self._cache.put(created.id, created)
+            self._invalidate_searches()
+            return created
         except cosmos_exceptions.CosmosResourceExistsError:
             accessory_id = accessory_dict["id"]
-            logger.error(f"Accessory with ID {accessory_id} already exists")
+            logger.error("Accessory with ID %s already exists", accessory_id)
             raise ValueError(
                 f"Accessory with ID {accessory_id} already exists")
         except cosmos_exceptions.CosmosHttpResponseError as e:
-            logger.error(f"CosmosDB HTTP error creating accessory: {e}")
+            logger.error("CosmosDB HTTP error creating accessory: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating accessory: {e}")
+            logger.error("Unexpected error creating accessory: %s", e)
             raise
 
-    def get_accessory(self, accessory_id: str) -> Optional[Accessory]:
-        """Get an accessory by ID."""
+    def _invalidate_searches(self) -> None:
+        """Forget cached search results after a write."""
+        self._search_generation += 1
+        self._search_cache.clear()
+
+    async def _read_accessory_item(
+        self, accessory_id: str, accessory_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the raw accessory document.
+
+        The container is partitioned by ``/type``. When the caller knows the type, this is
+        a single-partition point read; otherwise the item is located with an id query.
+        """
+        if accessory_type:
+            try:
+                return await self.container.read_item(
+                    item=accessory_id, partition_key=accessory_type)
+            except cosmos_exceptions.CosmosResourceNotFoundError:
+                return None
+
+        async for item in self.container.query_items(
+            query="SELECT * FROM c WHERE c.id = @id",
+            parameters=[{"name": "@id", "value": accessory_id}],
+            max_item_count=1,
+        ):
+            return item
+        return None
+
+    async def get_accessory(
+        self, accessory_id: str, accessory_type: Optional[str] = None
+    ) -> Optional[Accessory]:
+        """Get an accessory by ID, optionally scoped to its type (partition key)."""
+        cached = self._cache.get(accessory_id)
+        if cached is not None and (not accessory_type or cached.type == accessory_type):
+            return cached
+
         try:
             self._ensure_initialized()
-            response = self.container.read_item(
-                item=accessory_id, partition_key=accessory_id)
-            logger.info(f"Retrieved accessory: {accessory_id}")
-            return Accessory(**response)
-        except cosmos_exceptions.CosmosResourceNotFoundError:
-            logger.info(f"Accessory not found: {accessory_id}")
-            return None
+            response = await self._read_accessory_item(accessory_id, accessory_type)
+            if response is None:
+                logger.info("Accessory not found: %s", accessory_id)
+                return None
+
+            logger.info("Retrieved accessory: %s", accessory_id)
+            accessory = _accessory_from_document(response)
+            self._cache.put(accessory.id, accessory)
+            return accessory
         except cosmos_exceptions.CosmosHttpResponseError as e:
             logger.error(
-                f"CosmosDB HTTP error getting accessory {accessory_id}: {e}")
+                "CosmosDB HTTP error getting accessory %s: %s", accessory_id, e)
             raise
         except Exception as e:
             logger.error(
-                f"Unexpected error getting accessory {accessory_id}: {e}")
+                "Unexpected error getting accessory %s: %s", accessory_id, e)
             raise
 
-    def update_accessory(self, accessory_id: str, update_data: AccessoryUpdate) -> Optional[Accessory]:
-        """Update an accessory by ID."""
+    async def update_accessory(
+        self,
+        accessory_id: str,
+        update_data: AccessoryUpdate,
+        accessory_type: Optional[str] = None,
+    ) -> Optional[Accessory]:
+        """
+        Update an accessory by ID using a Cosmos partial-document patch.
+
+        An empty update is answered by ``get_accessory`` without writing. Only the
+        changed fields are sent. When the type (partition key) is known, no read is
+        needed before the patch unless exactly one of name/description changes.
+        Otherwise the current document is read first: to find its partition, to rebuild
+        ``searchText``, or to move it. A patch that depends on the read is conditioned
+        on its ETag and retried if another writer got there first. Changing ``type``
+        moves the document to another partition, which Cosmos cannot do in place: the
+        item is re-created under the new type and the old copy is deleted.
+        """
+        update_dict = update_data.model_dump(mode="json", exclude_unset=True)
+        if not update_dict:
+            # Nothing to change: answer from the read path (and its cache)
+            return await self.get_accessory(accessory_id, accessory_type)
+
+        self._cache.pop(accessory_id)
         try:
             self._ensure_initialized()
-            existing_accessory = self.get_accessory(accessory_id)
-            if not existing_accessory:
-                return None
 
-            update_dict = update_data.model_dump(exclude_unset=True)
-            if not update_dict:
-                return existing_accessory
-
-            accessory_dict = existing_accessory.model_dump(mode="json")
-            accessory_dict.update(update_dict)
-            accessory_dict["updatedAt"] = datetime.utcnow().isoformat()
+            for attempt in range(1, UPDATE_CONFLICT_ATTEMPTS + 1):
+                try:
+                    response = await self._apply_update(
+                        accessory_id, dict(update_dict), accessory_type)
+                    break
+                except cosmos_exceptions.CosmosAccessConditionFailedError:
+                    # The document changed between our read and the patch; start over
+                    if attempt == UPDATE_CONFLICT_ATTEMPTS:
+                        raise
+                    logger.info(
+                        "Concurrent update of accessory %s, retrying", accessory_id)
 
-            response = self.container.replace_item(
-                item=accessory_id, body=accessory_dict)
-            logger.info(f"Updated accessory: {accessory_id}")
+            if response is None:
+                return None
+            logger.info("Updated accessory: %s", accessory_id)
 
-            return Accessory(**response)
+            updated = _accessory_from_document(response)
+            self._cache.put(updated.id, updated)
+            self._invalidate_searches()
+            return updated
         except cosmos_exceptions.CosmosResourceNotFoundError:
-            logger.info(f"Accessory not found for update: {accessory_id}")
+            logger.info("Accessory not found for update: %s", accessory_id)
             return None
         except cosmos_exceptions.CosmosHttpResponseError as e:
             logger.error(
-                f"CosmosDB HTTP error updating accessory {accessory_id}: {e}")
+                "CosmosDB HTTP error updating accessory %s: %s", accessory_id, e)
             raise
         except Exception as e:
             logger.error(
-                f"Unexpected error updating accessory {accessory_id}: {e}")
+                "Unexpected error updating accessory %s: %s", accessory_id, e)
             raise
 
-    def delete_accessory(self, accessory_id: str) -> bool:
-        """Delete an accessory by ID."""
+    async def _apply_update(
+        self,
+        accessory_id: str,
+        update_dict: Dict[str, Any],
+        accessory_type: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Write one update attempt and return the stored document (``None`` if missing)."""
+        text_fields = update_dict.keys() & {"name", "description"}
+        existing_item: Optional[Dict[str, Any]] = None
+        needs_read = (
+            not accessory_type
+            or update_dict.get("type", accessory_type) != accessory_type
+            # searchText needs the unchanged one of name/description
+            or len(text_fields) == 1
+        )
+        if needs_read:
+            existing_item = await self._read_accessory_item(accessory_id, accessory_type)
+            if existing_item is None:
+                return None
+            accessory_type = existing_item["type"]
+
+        updated_at = datetime.now(timezone.utc).isoformat()
+
+        if update_dict.get("type", accessory_type) != accessory_type:
+            accessory_dict = _accessory_fields(existing_item)
+            accessory_dict.update(update_dict)
+            accessory_dict["searchText"] = _build_search_text(accessory_dict)
+            accessory_dict["updatedAt"] = updated_at
+
+            response = await self.container.create_item(body=accessory_dict)
+            try:
+                await self.container.delete_item(
+                    item=accessory_id, partition_key=accessory_type)
+            except Exception:
+                # The move is two separate writes; rather than leave the accessory in
+                # both partitions, remove the new copy before surfacing the error
+                logger.error(
+                    "Failed to remove accessory %s from type %s while moving it to %s; "
+                    "rolling back", accessory_id, accessory_type, accessory_dict['type'])
+                try:
+                    await self.container.delete_item(
+                        item=accessory_id, partition_key=accessory_dict["type"])
+                except Exception as rollback_error:
+                    logger.error(
+                        "Rollback failed; accessory %s now exists under both type %s and %s: %s",
+                        accessory_id, accessory_type, accessory_dict['type'], rollback_error)
+                raise
+            logger.info(
+                "Moved accessory %s from type %s to %s",
+                accessory_id, accessory_type, accessory_dict['type'])
+            return response
+
+        # The partition key path cannot be patched, even to its current value
+        update_dict.pop("type", None)
+        patch_operations = [
+            {"op": "set", "path": f"/{field}", "value": value}
+            for field, value in update_dict.items()
+        ]
+        if text_fields:
+            patch_operations.append({
+                "op": "set",
+                "path": "/searchText",
+                "value": _build_search_text({**(existing_item or {}), **update_dict}),
+            })
+        patch_operations.append(
+            {"op": "set", "path": "/updatedAt", "value": updated_at})
+
+        conditions: Dict[str, Any] = {}
+        if text_fields and existing_item is not None:
+            # searchText was derived from the document we read; only apply it if that
+            # document is still current
+            conditions = {
+                "etag": existing_item.get("_etag"),
+                "match_condition": MatchConditions.IfNotModified,
+            }
+        return await self.container.patch_item(
+            item=accessory_id,
+            partition_key=accessory_type,
+            patch_operations=patch_operations,
+            **conditions,
+        )
+
+    async def delete_accessory(
+        self, accessory_id: str, accessory_type: Optional[str] = None
+    ) -> bool:
+        """Delete an accessory by ID, optionally scoped to its type (partition key)."""
+        self._cache.pop(accessory_id)
         try:
             self._ensure_initialized()
-            self.container.delete_item(
-                item=accessory_id, partition_key=accessory_id)
-            logger.info(f"Deleted accessory: {accessory_id}")
+            if not accessory_type:
+                existing_item = await self._read_accessory_item(accessory_id)
+                if existing_item is None:
+                    logger.info("Accessory not found for deletion: %s", accessory_id)
+                    return False
+                accessory_type = existing_item["type"]
+
+            await self.container.delete_item(
+                item=accessory_id, partition_key=accessory_type)
+            logger.info("Deleted accessory: %s", accessory_id)
+            self._invalidate_searches()
             return True
         except cosmos_exceptions.CosmosResourceNotFoundError:
-            logger.info(f"Accessory not found for deletion: {accessory_id}")
+            logger.info("Accessory not found for deletion: %s", accessory_id)
             return False
         except cosmos_exceptions.CosmosHttpResponseError as e:
             logger.error(
-                f"CosmosDB HTTP error deleting accessory {accessory_id}: {e}")
+                "CosmosDB HTTP error deleting accessory %s: %s", accessory_id, e)
             raise
         except Exception as e:
             logger.error(
-                f"Unexpected error deleting accessory {accessory_id}: {e}")
+                "Unexpected error deleting accessory %s: %s", accessory_id, e)
             raise
 
-    async def search_accessories(self, filters: AccessorySearchFilters) -> List[Accessory]:
-        """Search accessories with filtering support."""
-        try:
-            self._ensure_initialized()
-
-            query_parts = ["SELECT * FROM c"]
-            parameters: List[Dict[str, Any]] = []
-            conditions: List[str] = []
-
-            if filters.search:
-                conditions.append(
-                    "(CONTAINS(c.name, @search) OR CONTAINS(c.description, @search))")
-                parameters.append({"name": "@search", "value": filters.search})
+    def _build_search_query(
+        self, filters: AccessorySearchFilters
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Build the parameterized Cosmos SQL query for the given search filters."""
+        query = _search_query_template(
+            bool(filters.search), bool(filters.type), bool(filters.lowStockOnly))
 
-            if filters.type:
-                conditions.append("c.type = @type")
-                parameters.append({"name": "@type", "value": filters.type})
+        parameters: List[Dict[str, Any]] = []
+        if filters.search:
+            parameters.append({"name": "@search", "value": filters.search.lower()})
+        if filters.type:
+            parameters.append({"name": "@type", "value": filters.type})
 
-            if filters.lowStockOnly:
-                conditions.append("c.stock < 10")
+        logger.debug(
+            "Executing query: %s with parameters: %s", query, parameters)
+        return query, parameters
 
-            if conditions:
-                query_parts.append("WHERE " + " AND ".join(conditions))
-
-            query_parts.append("ORDER BY c.createdAt DESC")
-            query_parts.append(
-                f"OFFSET {filters.offset} LIMIT {filters.limit}")
+    def _query_accessory_pages(self, filters: AccessorySearchFilters):
+        """
+        Start a paged search query, resuming from ``filters.continuationToken``.
 
-            query = " ".join(query_parts)
-            logger.debug(
-                f"Executing query: {query} with parameters: {parameters}")
+        Callers must only pass a token for type-scoped queries; see search_accessories.
+        """
+        query, parameters = self._build_search_query(filters)
+        # Type filters map onto the partition key, keeping the query single-partition
+        return self.container.query_items(
+            query=query,
+            parameters=parameters,
+            partition_key=filters.type,
+            max_item_count=filters.limit,
+        ).by_page(filters.continuationToken)
+
+    async def search_accessories(
+        self, filters: AccessorySearchFilters
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Search accessories with filtering support.
+
+        Returns a single page of at most ``filters.limit`` accessories together with the
+        continuation token for the next page (``None`` when there are no more results).
+        Paging with the token costs the same RUs for every page, unlike ``OFFSET`` which
+        makes Cosmos scan and discard the skipped rows.
+
+        Tokens are only issued and accepted for queries filtered by ``type``, the
+        partition key. Without it the query is a cross-partition ``ORDER BY``, and the SDK
+        resumes every partition from the same token, so a resumed page could skip or
+        repeat items once the container spans several physical partitions. Such searches
+        return the first page only, and passing a token raises ``ValueError``.
+
+        The documents are projected to the Accessory schema by the query, so they are
+        returned as plain dicts for the caller to serialize without building models.
+
+        Results are cached for a short time per filter combination and page token, and
+        dropped on any write made through this service. Only type-filtered searches carry
+        a token, so every cached page is one Cosmos can resume correctly. The cache keeps
+        its own copy of each page, and every call gets new dicts.
+        """
+        if filters.continuationToken and not filters.type:
+            raise ValueError("continuationToken is only supported together with type")
+
+        cache_key = (
+            self._search_generation,
+            filters.search.lower() if filters.search else None,
+            filters.type,
+            bool(filters.lowStockOnly),
+            filters.limit,
+            filters.continuationToken,
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            page, next_token = cached
+            return [dict(item) for item in page], next_token
 
-            items = list(
-                self.container.query_items(
-                    query=query,
-                    parameters=parameters,
-                    enable_cross_partition_query=True,
-                    max_item_count=filters.limit,
-                )
-            )
+        try:
+            self._ensure_initialized()
 
-            accessories: List[Accessory] = []
-            for item in items:
-                try:
-                    accessories.append(Accessory(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse accessory item: {e}")
-                    continue
-
-            logger.info(f"Search returned {len(accessories)} accessories")
-            return accessories
-        except (cosmos_exceptions.CosmosResourceNotFoundError, cosmos_exceptions.CosmosHttpResponseError) as e:
-            # Database or container doesn't exist - check if it's a "not found" type error
-            error_message = str(e).lower()
-            if "does not exist" in error_message or "notfound" in error_message or (
-                hasattr(e, "status_code") and e.status_code in [404, 500]
-            ):
-                logger.info(
-                    "Database or container not found during search. Creating and seeding with sample data...")
-                await self._create_database_and_seed()
-                # Retry the search after creating the database
-                return await self.search_accessories(filters)
-            else:
-                logger.error(f"CosmosDB HTTP error searching accessories: {e}")
-                raise
+            # Only the first page is read
+            accessories: List[Dict[str, Any]] = []
+            page_iterator = self._query_accessory_pages(filters)
+            async for page in page_iterator:
+                accessories = [item async for item in page]
+                break
+
+            logger.info("Search returned %s accessories", len(accessories))
+            next_token = page_iterator.continuation_token if filters.type else None
+            self._search_cache.put(
+                cache_key, (tuple(dict(item) for item in accessories), next_token))
+            return accessories, next_token
+        except cosmos_exceptions.CosmosResourceNotFoundError:
+            # 404: the database or container does not exist yet
+            logger.info(
+                "Database or container not found during search. Creating and seeding with sample data...")
+            await self._create_database_and_seed()
+            # Retry the search after creating the database
+            return await self.search_accessories(filters)
+        except cosmos_exceptions.CosmosHttpResponseError as e:
+            logger.error("CosmosDB HTTP error searching accessories: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error searching accessories: {e}")
+            logger.error("Unexpected error searching accessories: %s", e)
             raise
 
-    async def get_all_accessories(self, limit: int = 100, offset: int = 0) -> List[Accessory]:
-        """Get all accessories with pagination support."""
-        filters = AccessorySearchFilters(limit=limit, offset=offset)
-        return await self.search_accessories(filters)
+    async def close(self) -> None:
+        """Close the CosmosDB client, credential and HTTP session, releasing pooled connections."""
+        if self.client is not None:
+            await self.client.close()
+        if self.credential is not None:
+            await self.credential.close()
+        if self.http_session is not None:
+            await self.http_session.close()
+
+        self.client = None
+        self.credential = None
+        self.http_session = None
+        self.database = None
+        self.container = None
+        self._initialized = False
 
 
+# Singleton instance
+@lru_cache(maxsize=1)
 def get_cosmos_service() -> AccessoryCosmosService:
-    """Factory function to create and return a CosmosDB service instance."""
-    from config import get_settings
+    """
+    Get the singleton CosmosDB service instance.
 
+    The async CosmosClient owns an aiohttp session and the endpoint, partition-key-range
+    and container caches, so a single instance is shared across requests and closed
+    once on application shutdown.
+    """
     settings = get_settings()
     return AccessoryCosmosService(
         cosmos_endpoint=settings.cosmos_endpoint,
         cosmos_key=settings.cosmos_key,
         database_name=settings.cosmos_database_name,
         container_name=settings.cosmos_container_name,
+        preferred_locations=settings.cosmos_preferred_locations,
+        max_throughput=settings.cosmos_max_throughput,
+        disable_ssl_verify=settings.cosmos_emulator_disable_ssl_verify,
     )
@@ -11,7 +11,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from config import get_settings
 from models import Accessory, AccessoryCreate, AccessoryUpdate, AccessorySearchFilters
@@ -29,13 +29,24 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting Accessory Service API")
-    logger.info("CosmosDB connection will be established when first needed")
+    get_settings().validate_for_startup()
+
+    # Build the client and warm its connection and metadata caches before serving
+    # traffic, so the first user request does not pay for endpoint discovery
+    cosmos_health = await get_cosmos_service().startup()
+    if cosmos_health.get("status") != "healthy":
+        logger.warning(
+            "CosmosDB warm-up failed, will retry on first request: %s", cosmos_health.get("error"))
 
     yield
 
     # Shutdown
     logger.info("Shutting down Accessory Service API")
+    await get_cosmos_service().close()
+
 
+# Response header carrying the continuation token for the next page of results
+CONTINUATION_HEADER = "x-ms-continuation"
 
 # Initialize FastAPI app
 settings = get_settings()
@@ -43,7 +54,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Accessory management API with Azure CosmosDB backend",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -53,6 +65,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CONTINUATION_HEADER],
 )
 
 
@@ -75,7 +88,7 @@ async def value_error_handler(request, exc: ValueError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "An internal error occurred"}
@@ -105,7 +118,7 @@ async def health_check(db: AccessoryCosmosService = Depends(get_db)):
             "database": cosmos_health
         }
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service unhealthy"
@@ -122,7 +135,11 @@ async def get_accessories(
         None, description="Show only low stock items (stock < 10)"),
     limit: int = Query(100, ge=1, le=1000,
                        description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    continuationToken: Optional[str] = Query(
+        None, description=f"Continuation token from the previous page's {CONTINUATION_HEADER} header"),
+    offset: Optional[int] = Query(
+        None, ge=0, deprecated=True,
+        description="Removed: page with continuationToken instead. Only 0 is accepted"),
     db: AccessoryCosmosService = Depends(get_db)
 ):
     """
@@ -132,7 +149,12 @@ async def get_accessories(
     - **type**: Filter by accessory type (toy, food, collar, bedding, grooming, other)
     - **lowStockOnly**: Show only items with stock < 10
     - **limit**: Maximum number of results (1-1000)
-    - **offset**: Number of results to skip for pagination
+    - **continuationToken**: Resume after the previous page (requires type)
+    - **offset**: Deprecated; a non-zero offset is rejected with 400
+
+    When more results are available for a type-filtered query, the token for the next
+    page is returned in the `x-ms-continuation` response header. Searches across all
+    types return the first page only.
     """
     try:
         # Validate type filter
@@ -143,26 +165,44 @@ async def get_accessories(
                 detail=f"Invalid type. Must be one of: {', '.join(valid_types)}"
             )
 
+        # Offset paging was replaced by continuation tokens. Ignoring a non-zero offset
+        # would silently serve the first page again, so old clients get a clear error.
+        if offset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"offset paging is no longer supported; pass the {CONTINUATION_HEADER} "
+                       "response header back as continuationToken to fetch the next page"
+            )
+
+        # Continuation tokens only resume single-partition (type-filtered) queries
+        if continuationToken and not type:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="continuationToken is only supported together with type"
+            )
+
         # Create search filters
         filters = AccessorySearchFilters(
             search=search,
             type=type,
             lowStockOnly=lowStockOnly,
             limit=limit,
-            offset=offset
+            continuationToken=continuationToken
         )
 
-        # Search accessories
-        accessories = await db.search_accessories(filters)
+        # Search accessories; documents are already projected to the Accessory schema,
+        # so they are serialized as-is instead of being re-validated by FastAPI
+        accessories, next_token = await db.search_accessories(filters)
+        headers = {CONTINUATION_HEADER: next_token} if next_token else None
 
         logger.info(
-            f"Retrieved {len(accessories)} accessories with filters: {filters.model_dump()}")
-        return accessories
+            "Retrieved %s accessories with filters: %s", len(accessories), filters.model_dump())
+        return ORJSONResponse(content=accessories, headers=headers)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving accessories: {e}")
+        logger.error("Error retrieving accessories: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve accessories"
@@ -170,7 +210,7 @@ async def get_accessories(
 
 
 @app.post("/api/accessories", response_model=Accessory, status_code=status.HTTP_201_CREATED, tags=["Accessories"])
-def create_accessory(
+async def create_accessory(
     accessory_data: AccessoryCreate,
     db: AccessoryCosmosService = Depends(get_db)
 ):
@@ -186,8 +226,8 @@ def create_accessory(
     - **description**: Description of the accessory (optional)
     """
     try:
-        accessory = db.create_accessory(accessory_data)
-        logger.info(f"Created new accessory: {accessory.id}")
+        accessory = await db.create_accessory(accessory_data)
+        logger.info("Created new accessory: %s", accessory.id)
         return accessory
 
     except ValueError as e:
@@ -196,7 +236,7 @@ def create_accessory(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error creating accessory: {e}")
+        logger.error("Error creating accessory: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create accessory"
@@ -204,17 +244,20 @@ def create_accessory(
 
 
 @app.get("/api/accessories/{accessory_id}", response_model=Accessory, tags=["Accessories"])
-def get_accessory(
+async def get_accessory(
     accessory_id: str,
+    type: Optional[str] = Query(
+        None, description="Accessory type (partition key) for a single-partition point read"),
     db: AccessoryCosmosService = Depends(get_db)
 ):
     """
     Get a specific accessory by ID
 
     - **accessory_id**: Unique accessory identifier
+    - **type**: Optional accessory type; enables a direct point read
     """
     try:
-        accessory = db.get_accessory(accessory_id)
+        accessory = await db.get_accessory(accessory_id, type)
         if not accessory:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -226,7 +269,7 @@ def get_accessory(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving accessory {accessory_id}: {e}")
+        logger.error("Error retrieving accessory %s: %s", accessory_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve accessory"
@@ -234,32 +277,35 @@ def get_accessory(
 
 
 @app.patch("/api/accessories/{accessory_id}", response_model=Accessory, tags=["Accessories"])
-def update_accessory(
+async def update_accessory(
     accessory_id: str,
     update_data: AccessoryUpdate,
+    type: Optional[str] = Query(
+        None, description="Accessory type (partition key) for a single-partition point read"),
     db: AccessoryCosmosService = Depends(get_db)
 ):
     """
     Update an accessory by ID (partial update)
 
     - **accessory_id**: Unique accessory identifier
+    - **type**: Optional current accessory type; enables a direct point read
     - **Update fields**: Any combination of accessory fields to update
     """
     try:
-        accessory = db.update_accessory(accessory_id, update_data)
+        accessory = await db.update_accessory(accessory_id, update_data, type)
         if not accessory:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Accessory with ID {accessory_id} not found"
             )
 
-        logger.info(f"Updated accessory: {accessory_id}")
+        logger.info("Updated accessory: %s", accessory_id)
         return accessory
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating accessory {accessory_id}: {e}")
+        logger.error("Error updating accessory %s: %s", accessory_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update accessory"
@@ -267,30 +313,33 @@ def update_accessory(
 
 
 @app.delete("/api/accessories/{accessory_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Accessories"])
-def delete_accessory(
+async def delete_accessory(
     accessory_id: str,
+    type: Optional[str] = Query(
+        None, description="Accessory type (partition key) for a single-partition point read"),
     db: AccessoryCosmosService = Depends(get_db)
 ):
     """
     Delete an accessory by ID
 
     - **accessory_id**: Unique accessory identifier
+    - **type**: Optional accessory type; skips the lookup before deleting
     """
     try:
-        deleted = db.delete_accessory(accessory_id)
+        deleted = await db.delete_accessory(accessory_id, type)
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Accessory with ID {accessory_id} not found"
             )
 
-        logger.info(f"Deleted accessory: {accessory_id}")
+        logger.info("Deleted accessory: %s", accessory_id)
         return None
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting accessory {accessory_id}: {e}")
+        logger.error("Error deleting accessory %s: %s", accessory_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete accessory"
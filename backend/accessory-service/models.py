@@ -7,8 +7,8 @@ and type checking, following Azure CosmosDB best practices.
 
 import uuid
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, timezone
 from decimal import Decimal
 
 
@@ -42,14 +42,10 @@ class AccessoryUpdate(BaseModel):
 class Accessory(AccessoryBase):
     """Complete Accessory model with ID and metadata"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique accessory identifier")
-    createdAt: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updatedAt: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp")
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AccessorySearchFilters(BaseModel):
@@ -58,4 +54,4 @@ class AccessorySearchFilters(BaseModel):
     type: Optional[Literal["toy", "food", "collar", "bedding", "grooming", "other"]] = Field(None, description="Filter by accessory type")
     lowStockOnly: Optional[bool] = Field(None, description="Show only low stock items (stock < 10)")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
-    offset: int = Field(0, ge=0, description="Number of results to skip")
\ No newline at end of file
+    continuationToken: Optional[str] = Field(None, description="Continuation token returned with the previous page")
\ No newline at end of file
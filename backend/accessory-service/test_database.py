@@ -0,0 +1,244 @@
+"""
+Tests for AccessoryCosmosService update and search paths, run against a mocked container
+
+Run with: python -m pytest test_database.py -v
+"""
+
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+from azure.core import MatchConditions
+from azure.cosmos import exceptions as cosmos_exceptions
+
+os.environ.setdefault("COSMOS_ENDPOINT", "https://example.documents.azure.com:443/")
+os.environ.setdefault("COSMOS_KEY", "fake_key")
+
+from database import AccessoryCosmosService, UPDATE_CONFLICT_ATTEMPTS
+from models import AccessoryCreate, AccessorySearchFilters, AccessoryUpdate
+
+
+STORED_ACCESSORY = {
+    "id": "a1",
+    "name": "Squeaky Ball",
+    "type": "toy",
+    "price": 4.99,
+    "stock": 12,
+    "size": "S",
+    "imageUrl": None,
+    "description": "Rubber ball",
+    "searchText": "squeaky ball rubber ball",
+    "createdAt": "2025-01-01T00:00:00+00:00",
+    "updatedAt": "2025-01-01T00:00:00+00:00",
+    "_etag": "\"etag-1\"",
+}
+
+
+def _conflict():
+    return cosmos_exceptions.CosmosAccessConditionFailedError(
+        status_code=412, message="Precondition failed")
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class _FakePages:
+    """Stand-in for the by_page iterator returned by _query_accessory_pages"""
+
+    def __init__(self, items, continuation_token=None):
+        self.items = items
+        self.continuation_token = continuation_token
+
+    async def __aiter__(self):
+        yield _aiter(self.items)
+
+
+@pytest.fixture
+def service():
+    """Service wired to a mocked container, skipping client construction"""
+    svc = AccessoryCosmosService("https://example.documents.azure.com:443/", "fake_key")
+    svc.container = AsyncMock()
+    svc._initialized = True
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_update_with_known_type_patches_without_reading(service):
+    """A non-text update with the type hint is a single unconditioned patch"""
+    service.container.patch_item.return_value = {**STORED_ACCESSORY, "stock": 3}
+
+    updated = await service.update_accessory("a1", AccessoryUpdate(stock=3), "toy")
+
+    assert updated.stock == 3
+    service.container.read_item.assert_not_called()
+    kwargs = service.container.patch_item.call_args.kwargs
+    assert kwargs["partition_key"] == "toy"
+    assert "etag" not in kwargs
+    assert {"op": "set", "path": "/stock", "value": 3} in kwargs["patch_operations"]
+
+
+@pytest.mark.asyncio
+async def test_update_of_one_text_field_is_etag_conditioned(service):
+    """Rebuilding searchText from a read makes the patch conditional on that read"""
+    service.container.read_item.return_value = dict(STORED_ACCESSORY)
+    service.container.patch_item.return_value = {**STORED_ACCESSORY, "name": "Bouncy Ball"}
+
+    await service.update_accessory("a1", AccessoryUpdate(name="Bouncy Ball"), "toy")
+
+    kwargs = service.container.patch_item.call_args.kwargs
+    assert kwargs["etag"] == STORED_ACCESSORY["_etag"]
+    assert kwargs["match_condition"] == MatchConditions.IfNotModified
+    assert {"op": "set", "path": "/searchText", "value": "bouncy ball rubber ball"} \
+        in kwargs["patch_operations"]
+
+
+@pytest.mark.asyncio
+async def test_update_retries_after_concurrent_write(service):
+    """A failed ETag condition re-reads the document and patches again"""
+    service.container.read_item.return_value = dict(STORED_ACCESSORY)
+    service.container.patch_item.side_effect = [
+        _conflict(), {**STORED_ACCESSORY, "name": "Bouncy Ball"}]
+
+    updated = await service.update_accessory("a1", AccessoryUpdate(name="Bouncy Ball"), "toy")
+
+    assert updated.name == "Bouncy Ball"
+    assert service.container.read_item.await_count == 2
+    assert service.container.patch_item.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_gives_up_after_repeated_conflicts(service):
+    """The conflict is raised once every attempt has lost the race"""
+    service.container.read_item.return_value = dict(STORED_ACCESSORY)
+    service.container.patch_item.side_effect = _conflict()
+
+    with pytest.raises(cosmos_exceptions.CosmosAccessConditionFailedError):
+        await service.update_accessory("a1", AccessoryUpdate(name="Bouncy Ball"), "toy")
+
+    assert service.container.patch_item.await_count == UPDATE_CONFLICT_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_type_change_moves_accessory_to_new_partition(service):
+    """Changing the partition key re-creates the item and deletes the old copy"""
+    service.container.read_item.return_value = dict(STORED_ACCESSORY)
+    service.container.create_item.side_effect = lambda body: body
+
+    updated = await service.update_accessory("a1", AccessoryUpdate(type="other"), "toy")
+
+    assert updated.type == "other"
+    created = service.container.create_item.call_args.kwargs["body"]
+    assert created["id"] == "a1" and created["type"] == "other"
+    assert "_etag" not in created
+    service.container.delete_item.assert_awaited_once_with(item="a1", partition_key="toy")
+    service.container.patch_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_type_change_rolls_back_when_old_copy_cannot_be_deleted(service):
+    """A failed delete removes the new copy again instead of leaving a duplicate"""
+    service.container.read_item.return_value = dict(STORED_ACCESSORY)
+    service.container.create_item.side_effect = lambda body: body
+    service.container.delete_item.side_effect = [
+        cosmos_exceptions.CosmosHttpResponseError(status_code=503, message="Unavailable"),
+        None,
+    ]
+
+    with pytest.raises(cosmos_exceptions.CosmosHttpResponseError):
+        await service.update_accessory("a1", AccessoryUpdate(type="other"), "toy")
+
+    deletes = [call.kwargs for call in service.container.delete_item.await_args_list]
+    assert deletes == [
+        {"item": "a1", "partition_key": "toy"},
+        {"item": "a1", "partition_key": "other"},
+    ]
+
+
+@pytest.fixture
+def search_service(service):
+    """Service whose search queries return one page holding STORED_ACCESSORY"""
+    calls = []
+
+    def query_pages(filters):
+        calls.append(filters)
+        return _FakePages([dict(STORED_ACCESSORY)], continuation_token="next-page")
+
+    service._query_accessory_pages = query_pages
+    service.query_calls = calls
+    return service
+
+
+@pytest.mark.asyncio
+async def test_search_is_cached_and_returns_copies(search_service):
+    """Repeated searches are served from the cache without sharing its page"""
+    filters = AccessorySearchFilters(type="toy")
+
+    first, token = await search_service.search_accessories(filters)
+    first[0]["name"] = "Changed"
+    first.clear()
+    second, second_token = await search_service.search_accessories(filters)
+
+    assert len(search_service.query_calls) == 1
+    assert token == second_token == "next-page"
+    assert [item["name"] for item in second] == ["Squeaky Ball"]
+
+
+@pytest.mark.asyncio
+async def test_search_across_types_returns_first_page_without_token(search_service):
+    """Cross-partition searches cannot be resumed reliably, so no token is handed out"""
+    accessories, token = await search_service.search_accessories(
+        AccessorySearchFilters(search="ball"))
+
+    assert [item["id"] for item in accessories] == ["a1"]
+    assert token is None
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_token_without_type(search_service):
+    """A token is refused before any cross-partition query is resumed from it"""
+    with pytest.raises(ValueError, match="type"):
+        await search_service.search_accessories(
+            AccessorySearchFilters(continuationToken="token-1"))
+
+    assert search_service.query_calls == []
+
+
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_searches(search_service, write):
+    """Any write through the service makes the next search query Cosmos again"""
+    container = search_service.container
+    container.create_item.side_effect = lambda body: body
+    container.patch_item.return_value = {**STORED_ACCESSORY, "stock": 3}
+    filters = AccessorySearchFilters()
+
+    await search_service.search_accessories(filters)
+    if write == "create":
+        await search_service.create_accessory(AccessoryCreate(
+            name="Rope Toy", type="toy", price=3.5, stock=8, size="M"))
+    elif write == "update":
+        await search_service.update_accessory("a1", AccessoryUpdate(stock=3), "toy")
+    else:
+        await search_service.delete_accessory("a1", "toy")
+    await search_service.search_accessories(filters)
+
+    assert len(search_service.query_calls) == 2
+
+
+def test_cosmos_responses_are_decoded_by_orjson():
+    """The orjson swap targets a private SDK attribute, so pin it to the supported version"""
+    import json
+
+    import azure.cosmos
+    import orjson
+    from azure.cosmos.aio import _asynchronous_request
+
+    # Bump together with the azure-cosmos pin in requirements.txt after re-checking
+    # that the SDK still decodes responses through _asynchronous_request.json.loads
+    assert azure.cosmos.__version__ == "4.7.0"
+    assert _asynchronous_request.json.loads is orjson.loads
+
+    page = json.dumps({"Documents": [STORED_ACCESSORY], "_count": 1})
+    assert _asynchronous_request.json.loads(page) == json.loads(page)
@@ -19,3 +19,69 @@ def test_read_root():
     assert "message" in data
     assert "version" in data
     assert data["status"] == "healthy"
+
+
+def test_get_accessories_pages_by_continuation_token():
+    """The request token resumes the query and the next token comes back in a header"""
+    from unittest.mock import MagicMock
+
+    from database import AccessoryCosmosService
+    from main import CONTINUATION_HEADER, get_db
+
+    async def page_items():
+        yield {"id": "a2", "name": "Rope Toy", "type": "toy"}
+
+    class Pages:
+        continuation_token = "token-2"
+
+        async def __aiter__(self):
+            yield page_items()
+
+    service = AccessoryCosmosService("https://example.documents.azure.com:443/", "fake_key")
+    service.container = MagicMock()
+    service.container.query_items.return_value.by_page.return_value = Pages()
+    service._initialized = True
+
+    app.dependency_overrides[get_db] = lambda: service
+    try:
+        response = client.get("/api/accessories?type=toy&limit=1&continuationToken=token-1")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ["a2"]
+    assert response.headers[CONTINUATION_HEADER] == "token-2"
+    service.container.query_items.return_value.by_page.assert_called_once_with("token-1")
+    query_kwargs = service.container.query_items.call_args.kwargs
+    assert query_kwargs["partition_key"] == "toy"
+    assert query_kwargs["max_item_count"] == 1
+    # Token paging replaces OFFSET, so the query text carries no offset
+    assert "OFFSET" not in query_kwargs["query"]
+
+
+def test_get_accessories_rejects_removed_offset_paging():
+    """A non-zero offset is refused instead of silently returning the first page"""
+    response = client.get("/api/accessories?offset=20")
+    assert response.status_code == 400
+    assert "continuationToken" in response.json()["detail"]
+
+
+def test_get_accessories_rejects_continuation_token_without_type():
+    """Cross-partition searches cannot be resumed reliably, so a token needs a type"""
+    response = client.get("/api/accessories?continuationToken=token-1")
+    assert response.status_code == 400
+    assert "type" in response.json()["detail"]
+
+
+def test_invalid_max_throughput_fails_startup_not_import():
+    """COSMOS_MAX_RU is checked when the app starts, so the settings still build"""
+    from dataclasses import replace
+    from unittest.mock import patch
+
+    import main
+
+    settings = replace(main.get_settings(), cosmos_max_throughput=400)
+    with patch("main.get_settings", return_value=settings):
+        with pytest.raises(ValueError, match="COSMOS_MAX_RU"):
+            with TestClient(app):
+                pass
@@ -6,44 +6,100 @@ following Azure best practices for credential management.
 """
 
 import os
-from typing import Optional
-from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+COSMOS_CONSISTENCY_LEVELS = ("Strong", "BoundedStaleness", "Session", "ConsistentPrefix", "Eventual")
 
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings and configuration"""
-    
-    def __init__(self):
-        # CosmosDB Configuration
-        self.cosmos_endpoint: str = os.getenv("COSMOS_ENDPOINT", "")
-        self.cosmos_key: str = os.getenv("COSMOS_KEY", "")
-        self.cosmos_database_name: str = os.getenv("COSMOS_DATABASE_NAME", "activityservice")
-        self.cosmos_container_name: str = os.getenv("COSMOS_CONTAINER_NAME", "activities")
-        
-        # Application Configuration
-        self.app_name: str = "Activity Service API"
-        self.app_version: str = "1.0.0"
-        self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
-        
-        # Determine if running locally (CosmosDB Emulator) or in Azure
-        self.is_local: bool = self._is_local_development()
-        
+    """
+    Application settings and configuration
+
+    Immutable and built once at import time; validation runs in ``__post_init__``.
+    """
+
+    # CosmosDB Configuration
+    cosmos_endpoint: str
+    cosmos_key: str = field(default="", repr=False)
+    cosmos_database_name: str = "activityservice"
+    cosmos_container_name: str = "activities"
+    cosmos_preferred_locations: Tuple[str, ...] = ()
+    cosmos_emulator_disable_ssl_verify: bool = False
+    cosmos_consistency_level: str = "Session"
+
+    # CORS Configuration
+    cors_allowed_origins: Tuple[str, ...] = ("*",)
+
+    # Application Configuration
+    app_name: str = "Activity Service API"
+    app_version: str = "1.0.0"
+    debug: bool = False
+    # Uvicorn worker processes when not running in debug (auto-reload) mode
+    workers: int = 1
+
+    # Determine if running locally (CosmosDB Emulator) or in Azure
+    is_local: bool = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "is_local", self._is_local_development())
+
         # Validate required settings
         if not self.cosmos_endpoint:
             raise ValueError("COSMOS_ENDPOINT environment variable is required")
-        
+
+        if self.cosmos_consistency_level not in COSMOS_CONSISTENCY_LEVELS:
+            raise ValueError(
+                f"COSMOS_CONSISTENCY_LEVEL must be one of: {', '.join(COSMOS_CONSISTENCY_LEVELS)}")
+
+        if self.workers < 1:
+            raise ValueError("WEB_CONCURRENCY must be at least 1")
+
         # Key is only required for local development (emulator)
         if self.is_local and not self.cosmos_key:
             raise ValueError("COSMOS_KEY environment variable is required for local development")
-    
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables (and the optional .env file)"""
+        env = os.environ
+        return cls(
+            cosmos_endpoint=env.get("COSMOS_ENDPOINT", ""),
+            cosmos_key=env.get("COSMOS_KEY", ""),
+            cosmos_database_name=env.get("COSMOS_DATABASE_NAME", "activityservice"),
+            cosmos_container_name=env.get("COSMOS_CONTAINER_NAME", "activities"),
+            # Comma-separated Azure regions to route requests to first, e.g. "West Europe,North Europe"
+            cosmos_preferred_locations=tuple(
+                region.strip()
+                for region in env.get("COSMOS_PREFERRED_LOCATIONS", "").split(",")
+                if region.strip()
+            ),
+            # Comma-separated browser origins allowed to call the API; "*" allows any origin
+            cors_allowed_origins=tuple(
+                origin.strip()
+                for origin in env.get("CORS_ALLOWED_ORIGINS", "*").split(",")
+                if origin.strip()
+            ) or ("*",),
+            # Dev/emulator only: the emulator serves a self-signed certificate
+            cosmos_emulator_disable_ssl_verify=env.get(
+                "COSMOS_EMULATOR_DISABLE_SSL_VERIFY", "0").lower() in ("1", "true", "yes"),
+            # Read consistency for this client; Session keeps read-your-writes at 1x read RU
+            cosmos_consistency_level=env.get("COSMOS_CONSISTENCY_LEVEL", "Session"),
+            debug=env.get("DEBUG", "false").lower() == "true",
+            # One worker unless WEB_CONCURRENCY asks for more: the container app runs on
+            # 0.5 vCPU / 1Gi and every worker holds its own Cosmos client and caches
+            workers=int(env.get("WEB_CONCURRENCY", "1")),
+        )
+
     def _is_local_development(self) -> bool:
         """
         Detect if running in local development environment
-        
+
         Returns:
             True if running locally (CosmosDB Emulator), False if in Azure
         """
@@ -54,9 +110,9 @@ class Settings:
         return "localhost" in endpoint or "127.0.0.1" in endpoint
 
 
+_settings = Settings.from_env()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings"""
-    return Settings()
\ No newline at end of file
+    """Get application settings"""
+    return _settings
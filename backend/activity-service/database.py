@@ -10,19 +10,110 @@ Authentication Strategy:
 - Azure Deployment: Uses Entra ID (Managed Identity) authentication
 """
 
-import os
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+import orjson
+from collections import defaultdict
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime, timezone
-from azure.cosmos import CosmosClient, PartitionKey
+from functools import lru_cache
+from azure.cosmos import PartitionKey
 from azure.cosmos import exceptions as cosmos_exceptions
-from azure.identity import DefaultAzureCredential
+from azure.cosmos.aio import CosmosClient
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.identity.aio import DefaultAzureCredential
 from models import Activity, ActivityCreate, ActivityUpdate, ActivitySearchFilters
+from config import get_settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Activities are partitioned by pet, the dominant access pattern ("activities for pet X,
+# newest first"). The composite index serves that filter together with the ordering.
+# Only the properties search_activities filters or sorts on are indexed (``id`` is always
+# indexed by Cosmos); free-text ``notes`` and every other path are excluded to keep
+# write RU and index storage low. This is applied only when the service creates the
+# container itself (e.g. against the emulator); Azure containers are provisioned by
+# infra/main.bicep, which carries a copy that must be kept in sync.
+ACTIVITY_INDEXING_POLICY: Dict[str, Any] = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [
+        {"path": "/petId/?"},
+        {"path": "/type/?"},
+        {"path": "/timestamp/?"},
+    ],
+    "excludedPaths": [{"path": "/notes/?"}, {"path": "/*"}],
+    "compositeIndexes": [
+        [
+            {"path": "/petId", "order": "ascending"},
+            {"path": "/timestamp", "order": "descending"},
+        ]
+    ],
+}
+
+
+ACTIVITY_FIELDS: Tuple[str, ...] = tuple(Activity.model_fields)
+ACTIVITY_FIELDS_SET = set(ACTIVITY_FIELDS)
+ACTIVITY_DATETIME_FIELDS = ("timestamp", "createdAt", "updatedAt")
+
+# Project only the API fields so raw query results match the Activity schema
+# (no Cosmos system properties) and carry less payload.
+ACTIVITY_PROJECTION = ", ".join(f"c.{field}" for field in ACTIVITY_FIELDS)
+
+
+def _activity_from_document(document: Dict[str, Any]) -> Activity:
+    """
+    Build an Activity from a document this service stored, skipping validation
+
+    The document was validated when it was written, so only the ISO timestamps are
+    converted back; Cosmos system properties (``_rid``, ``_etag``, ``_ts``, ...) are dropped.
+    """
+    values = {field: document[field] for field in ACTIVITY_FIELDS if field in document}
+    for field in ACTIVITY_DATETIME_FIELDS:
+        if isinstance(values.get(field), str):
+            values[field] = datetime.fromisoformat(values[field])
+    return Activity.model_construct(_fields_set=ACTIVITY_FIELDS_SET, **values)
+
+
+# Client-side timeouts (seconds) so a stalled Cosmos call fails fast instead of holding a
+# request for minutes: connecting a socket, and waiting for response data once connected
+COSMOS_CONNECTION_TIMEOUT_SECONDS = 5
+COSMOS_READ_TIMEOUT_SECONDS = 10
+
+# Search filters by bit in the filter-shape mask, with the condition each one adds
+SEARCH_FILTER_PET_ID = 0b1000
+SEARCH_FILTER_TYPE = 0b0100
+SEARCH_FILTER_FROM = 0b0010
+SEARCH_FILTER_TO = 0b0001
+_SEARCH_CONDITIONS: Tuple[Tuple[int, str], ...] = (
+    (SEARCH_FILTER_PET_ID, "c.petId = @petId"),
+    (SEARCH_FILTER_TYPE, "c.type = @type"),
+    (SEARCH_FILTER_FROM, "c.timestamp >= @from_timestamp"),
+    (SEARCH_FILTER_TO, "c.timestamp <= @to_timestamp"),
+)
+
+
+def _build_search_query_text(mask: int) -> str:
+    """
+    Build the search SQL for a combination of filters
+
+    Filter values are always bound as parameters, so every request with the same filter
+    shape sends byte-identical query text and Cosmos can reuse its cached query plan.
+    """
+    conditions = [condition for bit, condition in _SEARCH_CONDITIONS if mask & bit]
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Pagination is handled with continuation tokens rather than OFFSET/LIMIT
+    return f"SELECT {ACTIVITY_PROJECTION} FROM c{where} ORDER BY c.timestamp DESC"
+
+
+# All 16 filter shapes are few enough to build up front, leaving a single dict lookup
+# per request
+_SEARCH_QUERIES: Dict[int, str] = {
+    mask: _build_search_query_text(mask) for mask in range(1 << len(_SEARCH_CONDITIONS))
+}
+
 
 class ActivityCosmosService:
     """
@@ -32,7 +123,9 @@ class ActivityCosmosService:
     following Azure CosmosDB best practices for partition key usage and query optimization.
     """
 
-    def __init__(self, cosmos_endpoint: str, cosmos_key: str, database_name: str = "activityservice", container_name: str = "activities"):
+    def __init__(self, cosmos_endpoint: str, cosmos_key: str, database_name: str = "activityservice", container_name: str = "activities",
+                 preferred_locations: Optional[Sequence[str]] = None, is_local: bool = False,
+                 disable_ssl_verify: bool = False, consistency_level: Optional[str] = "Session"):
         """
         Initialize the CosmosDB service
 
@@ -41,16 +134,27 @@ class ActivityCosmosService:
             cosmos_key: Azure CosmosDB access key
             database_name: CosmosDB database name
             container_name: CosmosDB container name
+            preferred_locations: Azure regions to route requests to, in order of preference
+            is_local: Whether the endpoint is the local CosmosDB Emulator (key-based auth)
+            disable_ssl_verify: Skip TLS certificate verification (emulator only)
+            consistency_level: Read consistency requested by the client (may only relax
+                the account default); None keeps the account default
         """
         self.cosmos_endpoint = cosmos_endpoint
         self.cosmos_key = cosmos_key
         self.database_name = database_name
         self.container_name = container_name
+        self.preferred_locations = list(preferred_locations or [])
+        self.is_local = is_local
+        self.disable_ssl_verify = disable_ssl_verify
+        self.consistency_level = consistency_level
 
         # Initialize client, database, and container as None (lazy initialization)
-        self.client = None
+        self.client: Optional[CosmosClient] = None
+        self.credential: Optional[DefaultAzureCredential] = None
         self.database = None
         self.container = None
+        self._initialized = False
 
         logger.info("ActivityCosmosService initialized with lazy loading")
 
@@ -62,26 +166,34 @@ class ActivityCosmosService:
         - Local (localhost): Key-based authentication with optional SSL verification disabled
         - Azure: Entra ID (Managed Identity) authentication via DefaultAzureCredential
         """
-        # Detect if running locally
-        is_local = "localhost" in self.cosmos_endpoint.lower(
-        ) or "127.0.0.1" in self.cosmos_endpoint
-
         options: Dict[str, Any] = {
             "url": self.cosmos_endpoint,
-            "connection_timeout": 30,
-            "request_timeout": 30,
+            # Note: the legacy ``request_timeout`` option is in milliseconds and would
+            # override this value, so only ``connection_timeout`` is set
+            "connection_timeout": COSMOS_CONNECTION_TIMEOUT_SECONDS,
+            # Transient connection and read failures are retried with exponential backoff;
+            # throttled (429) requests keep the SDK's own policy of up to 9 retries
+            "retry_connect": 3,
+            "retry_read": 3,
+            "retry_backoff_factor": 0.5,
+            "transport": AioHttpTransport(read_timeout=COSMOS_READ_TIMEOUT_SECONDS),
         }
 
-        if is_local:
+        if self.consistency_level:
+            # Strong and Bounded Staleness reads cost twice the RUs of Session/Eventual ones
+            options["consistency_level"] = self.consistency_level
+
+        if self.preferred_locations and not self.is_local:
+            # Route requests to the nearest replica instead of the account's write region
+            options["preferred_locations"] = self.preferred_locations
+
+        if self.is_local:
             # Local development: Use key-based authentication
             logger.info("Using key-based authentication (local development)")
             options["credential"] = self.cosmos_key
 
-            # Check if SSL verification should be disabled (for emulator)
-            disable_ssl_verify = os.getenv(
-                "COSMOS_EMULATOR_DISABLE_SSL_VERIFY", "0").lower() in ("1", "true", "yes")
-
-            if disable_ssl_verify:
+            # SSL verification may be disabled for the emulator's self-signed certificate
+            if self.disable_ssl_verify:
                 options["connection_verify"] = False  # type: ignore[arg-type]
                 logger.warning(
                     "COSMOS_EMULATOR_DISABLE_SSL_VERIFY is enabled – SSL certificate verification DISABLED (dev/emulator only)")
@@ -89,13 +201,17 @@ class ActivityCosmosService:
             # Azure deployment: Use Entra ID (Managed Identity) authentication
             logger.info(
                 "Using Entra ID authentication (Azure deployment with Managed Identity)")
-            credential = DefaultAzureCredential()
-            options["credential"] = credential
+            self.credential = DefaultAzureCredential()
+            options["credential"] = self.credential
 
         return options
 
     def _ensure_initialized(self):
         """Ensure the CosmosDB client, database, and container are initialized"""
+        # Fast path once startup() (or an earlier call) has built the clients
+        if self._initialized:
+            return
+
         if self.client is None:
             logger.info("Initializing CosmosDB client...")
             cosmos_client_options = self._build_cosmos_client_options()
@@ -114,6 +230,20 @@ class ActivityCosmosService:
             self.container = self.database.get_container_client(
                 self.container_name)
 
+        self._initialized = True
+
+    async def startup(self) -> dict:
+        """
+        Initialize the service once before it serves traffic
+
+        Builds the client, database and container proxies, then runs the health check
+        to warm the SDK's connection and metadata caches. Building the proxies makes no
+        network calls, so later operations find them in place even when CosmosDB is
+        unreachable at startup.
+        """
+        self._ensure_initialized()
+        return await self.health_check()
+
     async def health_check(self) -> dict:
         """
         Perform health check and auto-create database/container if needed
@@ -127,11 +257,10 @@ class ActivityCosmosService:
 
             # Try to perform a simple query to verify connection
             try:
-                items = list(self.container.query_items(
+                items = [item async for item in self.container.query_items(
                     query="SELECT TOP 1 c.id FROM c",
-                    enable_cross_partition_query=True,
                     max_item_count=1
-                ))
+                )]
 
                 if items:
                     return {"status": "healthy", "database": self.database_name}
@@ -173,15 +302,16 @@ class ActivityCosmosService:
         try:
             # Create database if it doesn't exist
             logger.info(f"Creating database: {self.database_name}")
-            database = self.client.create_database_if_not_exists(
+            database = await self.client.create_database_if_not_exists(
                 id=self.database_name
             )
 
             # Create container if it doesn't exist
             logger.info(f"Creating container: {self.container_name}")
-            container = database.create_container_if_not_exists(
+            container = await database.create_container_if_not_exists(
                 id=self.container_name,
-                partition_key=PartitionKey(path="/id"),
+                partition_key=PartitionKey(path="/petId"),
+                indexing_policy=ACTIVITY_INDEXING_POLICY,
                 offer_throughput=400  # Minimum RU/s for manual throughput
             )
 
@@ -208,6 +338,7 @@ class ActivityCosmosService:
                 "Cosmos container is not initialized; cannot seed database")
 
         logger.info("Seeding container with sample activity data")
+        now_iso = datetime.now(timezone.utc).isoformat()
         sample_activities = [
             {
                 "id": "a1",
@@ -215,8 +346,8 @@ class ActivityCosmosService:
                 "type": "walk",
                 "timestamp": "2025-10-05T08:30:00Z",
                 "notes": "Park loop",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
+                "createdAt": now_iso,
+                "updatedAt": now_iso
             },
             {
                 "id": "a2",
@@ -224,8 +355,8 @@ class ActivityCosmosService:
                 "type": "feed",
                 "timestamp": "2025-10-05T07:00:00Z",
                 "notes": "Tuna pouch",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
+                "createdAt": now_iso,
+                "updatedAt": now_iso
             },
             {
                 "id": "a3",
@@ -233,23 +364,48 @@ class ActivityCosmosService:
                 "type": "play",
                 "timestamp": "2025-10-04T18:00:00Z",
                 "notes": "Frisbee",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
+                "createdAt": now_iso,
+                "updatedAt": now_iso
             }
         ]
 
-        # Insert sample activities
+        # Transactional batches are scoped to one partition, so group seeds by pet
+        activities_by_pet: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for activity_data in sample_activities:
-            try:
-                self.container.create_item(body=activity_data)
-                logger.info(
-                    f"Seeded activity: {activity_data['id']} - {activity_data['type']} ({activity_data['notes']})")
-            except cosmos_exceptions.CosmosResourceExistsError:
-                logger.info(
-                    f"Activity {activity_data['id']} already exists, skipping")
-                continue
+            activities_by_pet[activity_data["petId"]].append(activity_data)
 
-    def create_activity(self, activity_data: ActivityCreate) -> Activity:
+        # Partitions are independent, so their batches are submitted concurrently
+        await asyncio.gather(*(
+            self._seed_partition(pet_id, activities)
+            for pet_id, activities in activities_by_pet.items()
+        ))
+
+    async def _seed_partition(self, pet_id: str, activities: List[Dict[str, Any]]) -> None:
+        """Seed the activities of one pet as a single transactional batch."""
+        try:
+            await self.container.execute_item_batch(
+                batch_operations=[("create", (activity_data,)) for activity_data in activities],
+                partition_key=pet_id
+            )
+            logger.info(
+                f"Seeded {len(activities)} activities for pet {pet_id}")
+        except cosmos_exceptions.CosmosBatchOperationError:
+            # The batch is all-or-nothing; retry item by item to skip existing ones
+            results = await asyncio.gather(
+                *(self.container.create_item(body=activity_data) for activity_data in activities),
+                return_exceptions=True
+            )
+            for activity_data, result in zip(activities, results):
+                if isinstance(result, cosmos_exceptions.CosmosResourceExistsError):
+                    logger.info(
+                        f"Activity {activity_data['id']} already exists, skipping")
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    logger.info(
+                        f"Seeded activity: {activity_data['id']} - {activity_data['type']} ({activity_data['notes']})")
+
+    async def create_activity(self, activity_data: ActivityCreate) -> Activity:
         """
         Create a new activity in CosmosDB
 
@@ -267,17 +423,19 @@ class ActivityCosmosService:
             self._ensure_initialized()
 
             # Create Activity object with generated ID and timestamps
+            now = datetime.now(timezone.utc)
             activity = Activity(
                 **activity_data.model_dump(),
-                createdAt=datetime.utcnow(),
-                updatedAt=datetime.utcnow()
+                createdAt=now,
+                updatedAt=now
             )
 
-            # Convert to dictionary for CosmosDB (with JSON serialization)
-            activity_dict = activity.model_dump(mode='json')
+            # Convert to a JSON-compatible dictionary for CosmosDB; model_dump_json runs
+            # in pydantic-core and is faster than model_dump(mode='json')
+            activity_dict = orjson.loads(activity.model_dump_json())
 
             # Create item in CosmosDB
-            response = self.container.create_item(body=activity_dict)
+            response = await self.container.create_item(body=activity_dict)
             logger.info(f"Created activity: {response['id']}")
 
             return Activity(**response)
@@ -289,12 +447,41 @@ class ActivityCosmosService:
             logger.error(f"Unexpected error creating activity: {e}")
             raise
 
-    def get_activity(self, activity_id: str) -> Optional[Activity]:
+    async def _read_activity_item(self, activity_id: str, pet_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read the raw activity document
+
+        The container is partitioned by ``/petId``. When the caller knows the pet, this
+        is a single-partition point read; otherwise the item is located with an id query.
+
+        Args:
+            activity_id: The activity ID to retrieve
+            pet_id: The pet the activity belongs to (partition key), if known
+
+        Returns:
+            The stored document, or None if not found
+        """
+        if pet_id:
+            try:
+                return await self.container.read_item(item=activity_id, partition_key=pet_id)
+            except cosmos_exceptions.CosmosResourceNotFoundError:
+                return None
+
+        async for item in self.container.query_items(
+            query="SELECT * FROM c WHERE c.id = @id",
+            parameters=[{"name": "@id", "value": activity_id}],
+            max_item_count=1
+        ):
+            return item
+        return None
+
+    async def get_activity(self, activity_id: str, pet_id: Optional[str] = None) -> Optional[Activity]:
         """
         Get a specific activity by ID
 
         Args:
             activity_id: The activity ID to retrieve
+            pet_id: The pet the activity belongs to (partition key), if known
 
         Returns:
             Activity object if found, None otherwise
@@ -303,16 +490,13 @@ class ActivityCosmosService:
             # Ensure client is initialized
             self._ensure_initialized()
 
-            # Read item from CosmosDB using ID as partition key
-            response = self.container.read_item(
-                item=activity_id, partition_key=activity_id)
+            response = await self._read_activity_item(activity_id, pet_id)
+            if response is None:
+                logger.info(f"Activity not found: {activity_id}")
+                return None
             logger.info(f"Retrieved activity: {activity_id}")
 
-            return Activity(**response)
-
-        except cosmos_exceptions.CosmosResourceNotFoundError:
-            logger.info(f"Activity not found: {activity_id}")
-            return None
+            return _activity_from_document(response)
         except cosmos_exceptions.CosmosHttpResponseError as e:
             logger.error(
                 f"CosmosDB HTTP error retrieving activity {activity_id}: {e}")
@@ -322,126 +506,80 @@ class ActivityCosmosService:
                 f"Unexpected error retrieving activity {activity_id}: {e}")
             raise
 
-    async def get_all_activities(self) -> List[Activity]:
-        """
-        Get all activities from CosmosDB
-
-        Returns:
-            List of Activity objects
+    async def search_activities(self, filters: ActivitySearchFilters) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        try:
-            # Ensure client is initialized
-            self._ensure_initialized()
-
-            # Query all activities ordered by timestamp (most recent first)
-            query = "SELECT * FROM c ORDER BY c.timestamp DESC"
-
-            items = list(self.container.query_items(
-                query=query,
-                enable_cross_partition_query=True
-            ))
-
-            logger.info(f"Retrieved {len(items)} activities")
-
-            # Convert to Activity objects
-            activities = []
-            for item in items:
-                try:
-                    activities.append(Activity(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse activity item: {e}")
-                    continue
+        Search activities with filters and pagination
 
-            return activities
+        Only a single page of results is fetched. Paging with the continuation token
+        costs the same RUs for every page, unlike ``OFFSET`` which makes Cosmos scan and
+        discard the skipped rows.
 
-        except (cosmos_exceptions.CosmosResourceNotFoundError, cosmos_exceptions.CosmosHttpResponseError) as e:
-            # Database or container doesn't exist - check if it's a "not found" type error
-            error_message = str(e).lower()
-            if "does not exist" in error_message or "notfound" in error_message or (hasattr(e, 'status_code') and e.status_code in [404, 500]):
-                logger.info(
-                    "Database or container not found during get_all. Creating and seeding with sample data...")
-                await self._create_database_and_seed()
-                # Retry after creating the database
-                return await self.get_all_activities()
-            else:
-                logger.error(f"CosmosDB HTTP error retrieving activities: {e}")
-                raise
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving activities: {e}")
-            raise
+        Tokens are only issued and accepted for queries scoped to one pet. Without a
+        ``petId`` the query is a cross-partition ``ORDER BY``, and the SDK resumes every
+        partition from the same token, so a resumed page could skip or repeat items once
+        the container spans several physical partitions; such listings return the first
+        page only.
 
-    async def search_activities(self, filters: ActivitySearchFilters) -> List[Activity]:
-        """
-        Search activities with filters and pagination
+        The documents are projected to the Activity schema by the query, so they are
+        returned as plain dicts for the caller to serialize without building models.
 
         Args:
             filters: Search and filter parameters
 
         Returns:
-            List of Activity objects matching the criteria
+            Tuple of at most ``filters.limit`` activity dicts matching the criteria and
+            the continuation token for the next page (None when there are no more results
+            or no ``petId`` was given)
+
+        Raises:
+            ValueError: A continuation token was given without a ``petId``
         """
+        if filters.continuationToken and not filters.petId:
+            raise ValueError("continuationToken is only supported together with petId")
+
         try:
             # Ensure client is initialized
             self._ensure_initialized()
 
-            # Build SQL query based on filters
-            query_parts = ["SELECT * FROM c"]
+            mask = 0
             parameters = []
-            conditions = []
-
-            # Add petId filter
             if filters.petId:
-                conditions.append("c.petId = @petId")
+                mask |= SEARCH_FILTER_PET_ID
                 parameters.append({"name": "@petId", "value": filters.petId})
-
-            # Add activity type filter
             if filters.type:
-                conditions.append("c.type = @type")
+                mask |= SEARCH_FILTER_TYPE
                 parameters.append({"name": "@type", "value": filters.type})
-
-            # Add timestamp range filters
             if filters.from_timestamp:
-                conditions.append("c.timestamp >= @from_timestamp")
+                mask |= SEARCH_FILTER_FROM
                 parameters.append(
                     {"name": "@from_timestamp", "value": filters.from_timestamp.isoformat()})
-
             if filters.to_timestamp:
-                conditions.append("c.timestamp <= @to_timestamp")
+                mask |= SEARCH_FILTER_TO
                 parameters.append(
                     {"name": "@to_timestamp", "value": filters.to_timestamp.isoformat()})
+            query = _SEARCH_QUERIES[mask]
 
-            # Add WHERE clause if there are conditions
-            if conditions:
-                query_parts.append("WHERE " + " AND ".join(conditions))
-
-            # Add ordering and pagination
-            query_parts.append("ORDER BY c.timestamp DESC")
-            query_parts.append(
-                f"OFFSET {filters.offset} LIMIT {filters.limit}")
-
-            query = " ".join(query_parts)
             logger.debug(
                 f"Executing query: {query} with parameters: {parameters}")
 
-            # Execute query
-            items = list(self.container.query_items(
+            # Execute query; a petId filter maps onto the partition key, keeping the
+            # query single-partition
+            page_iterator = self.container.query_items(
                 query=query,
                 parameters=parameters,
-                enable_cross_partition_query=True,
+                partition_key=filters.petId,
                 max_item_count=filters.limit
-            ))
+            ).by_page(filters.continuationToken)
 
-            # Convert to Activity objects
+            # Only the first page is read
             activities = []
-            for item in items:
-                try:
-                    activities.append(Activity(**item))
-                except Exception as e:
-                    logger.warning(f"Failed to parse activity item: {e}")
-                    continue
+            async for page in page_iterator:
+                activities = [item async for item in page]
+                break
 
             logger.info(f"Search returned {len(activities)} activities")
-            return activities
+            next_token = page_iterator.continuation_token if filters.petId else None
+            return activities, next_token
 
         except (cosmos_exceptions.CosmosResourceNotFoundError, cosmos_exceptions.CosmosHttpResponseError) as e:
             # Database or container doesn't exist - check if it's a "not found" type error
@@ -459,12 +597,13 @@ class ActivityCosmosService:
             logger.error(f"Unexpected error searching activities: {e}")
             raise
 
-    def delete_activity(self, activity_id: str) -> bool:
+    async def delete_activity(self, activity_id: str, pet_id: Optional[str] = None) -> bool:
         """
         Delete an activity by ID
 
         Args:
             activity_id: The activity ID to delete
+            pet_id: The pet the activity belongs to (partition key), if known
 
         Returns:
             True if deleted successfully, False if not found
@@ -473,9 +612,16 @@ class ActivityCosmosService:
             # Ensure client is initialized
             self._ensure_initialized()
 
+            if not pet_id:
+                existing_item = await self._read_activity_item(activity_id)
+                if existing_item is None:
+                    logger.info(f"Activity not found for deletion: {activity_id}")
+                    return False
+                pet_id = existing_item["petId"]
+
             # Delete item from CosmosDB
-            self.container.delete_item(
-                item=activity_id, partition_key=activity_id)
+            await self.container.delete_item(
+                item=activity_id, partition_key=pet_id)
             logger.info(f"Deleted activity: {activity_id}")
 
             return True
@@ -493,20 +639,42 @@ class ActivityCosmosService:
             raise
 
 
+    async def close(self) -> None:
+        """Close the CosmosDB client and credential, releasing pooled connections"""
+        if self.client is not None:
+            await self.client.close()
+        if self.credential is not None:
+            await self.credential.close()
+
+        self.client = None
+        self.credential = None
+        self.database = None
+        self.container = None
+        self._initialized = False
+
+
 # Service instance factory
+@lru_cache(maxsize=1)
 def get_cosmos_service() -> ActivityCosmosService:
     """
-    Factory function to create and return a CosmosDB service instance
+    Factory function to return the shared CosmosDB service instance
+
+    The async CosmosClient owns an aiohttp session plus the endpoint and
+    partition-key-range caches, so a single instance is shared across requests
+    and closed once on application shutdown.
 
     Returns:
         ActivityCosmosService instance configured with environment variables
     """
-    from config import get_settings
     settings = get_settings()
 
     return ActivityCosmosService(
         cosmos_endpoint=settings.cosmos_endpoint,
         cosmos_key=settings.cosmos_key,
         database_name=settings.cosmos_database_name,
-        container_name=settings.cosmos_container_name
+        container_name=settings.cosmos_container_name,
+        preferred_locations=settings.cosmos_preferred_locations,
+        is_local=settings.is_local,
+        disable_ssl_verify=settings.cosmos_emulator_disable_ssl_verify,
+        consistency_level=settings.cosmos_consistency_level
     )
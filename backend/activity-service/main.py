@@ -11,6 +11,7 @@ from contextlib import asynccontextmanager
 from typing import List, Optional
 from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 
 from models import Activity, ActivityCreate, ActivitySearchFilters
@@ -26,16 +27,25 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """
     Application lifespan manager for startup and shutdown events
-    Uses lazy initialization to avoid blocking startup if CosmosDB is not available
+    Connects to CosmosDB at startup, but does not block startup if it is not available
     """
     logger.info("🚀 Activity Service starting up...")
-    logger.info(
-        "Using lazy initialization - CosmosDB will be connected on first request")
+
+    # Build the shared client and warm its connection and metadata caches before
+    # serving traffic, so the first user request does not pay for them
+    cosmos_health = await get_cosmos_service().startup()
+    if cosmos_health.get("status") != "healthy":
+        logger.warning(
+            f"CosmosDB warm-up failed, will retry on first request: {cosmos_health.get('error')}")
 
     yield
 
     logger.info("🛑 Activity Service shutting down...")
+    await get_cosmos_service().close()
+
 
+# Response header carrying the continuation token for the next page of results
+CONTINUATION_HEADER = "x-ms-continuation"
 
 # Initialize FastAPI app
 settings = get_settings()
@@ -45,16 +55,21 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Configure CORS; set CORS_ALLOWED_ORIGINS to the frontend origins in production.
+# Credentials are only allowed with an explicit origin list, since a wildcard origin
+# with credentials is rejected by browsers. Preflight results are cached for an hour.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=list(settings.cors_allowed_origins),
+    allow_credentials="*" not in settings.cors_allowed_origins,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=[CONTINUATION_HEADER],
+    max_age=3600,
 )
 
 
@@ -115,7 +130,8 @@ async def get_activities(
         None, description="Filter activities to this timestamp (ISO format)"),
     limit: int = Query(100, ge=1, le=1000,
                        description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    continuationToken: Optional[str] = Query(
+        None, description=f"Continuation token from the previous page's {CONTINUATION_HEADER} header"),
     db_service: ActivityCosmosService = Depends(get_db_service)
 ):
     """
@@ -126,7 +142,11 @@ async def get_activities(
     - **from**: Filter activities from this timestamp (ISO format)
     - **to**: Filter activities to this timestamp (ISO format)  
     - **limit**: Maximum number of results (1-1000, default: 100)
-    - **offset**: Number of results to skip for pagination (default: 0)
+    - **continuationToken**: Resume after the previous page (requires petId)
+
+    When more results are available for a petId-scoped query, the token for the next page
+    is returned in the `x-ms-continuation` response header. Listings across all pets
+    return the first page only.
     """
     try:
         # Create search filters
@@ -136,22 +156,19 @@ async def get_activities(
             from_timestamp=from_param,
             to_timestamp=to,
             limit=limit,
-            offset=offset
+            continuationToken=continuationToken
         )
 
-        # If no filters provided, get all activities
-        if not any([petId, type, from_param, to]):
-            activities = await db_service.get_all_activities()
-        else:
-            activities = await db_service.search_activities(filters)
-
-        # Apply client-side pagination if needed (for get_all_activities)
-        if not any([petId, type, from_param, to]) and (offset > 0 or limit < 1000):
-            end_index = offset + limit
-            activities = activities[offset:end_index]
+        # Unfiltered requests go through the same query, so only one page is read.
+        # Documents are already projected to the Activity schema, so they are serialized
+        # as-is instead of being built into models and re-validated by FastAPI.
+        activities, next_token = await db_service.search_activities(filters)
+        headers = {CONTINUATION_HEADER: next_token} if next_token else None
 
-        return activities
+        return ORJSONResponse(content=activities, headers=headers)
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving activities: {e}")
         raise HTTPException(
@@ -172,7 +189,7 @@ async def create_activity(
     - **notes**: Additional notes about the activity (optional, max 1000 chars)
     """
     try:
-        activity = db_service.create_activity(activity_data)
+        activity = await db_service.create_activity(activity_data)
         logger.info(f"Created activity {activity.id} for pet {activity.petId}")
         return activity
 
@@ -185,15 +202,18 @@ async def create_activity(
 @app.get("/api/activities/{activity_id}", response_model=Activity, tags=["Activities"])
 async def get_activity(
     activity_id: str,
+    petId: Optional[str] = Query(
+        None, description="Pet ID (partition key) for a single-partition point read"),
     db_service: ActivityCosmosService = Depends(get_db_service)
 ):
     """
     Get a specific activity by ID
 
     - **activity_id**: The unique identifier of the activity
+    - **petId**: Optional pet ID; makes the lookup a cheaper point read
     """
     try:
-        activity = db_service.get_activity(activity_id)
+        activity = await db_service.get_activity(activity_id, petId)
         if not activity:
             raise HTTPException(
                 status_code=404, detail=f"Activity with ID {activity_id} not found")
@@ -211,15 +231,18 @@ async def get_activity(
 @app.delete("/api/activities/{activity_id}", tags=["Activities"])
 async def delete_activity(
     activity_id: str,
+    petId: Optional[str] = Query(
+        None, description="Pet ID (partition key) to skip the lookup before deleting"),
     db_service: ActivityCosmosService = Depends(get_db_service)
 ):
     """
     Delete an activity by ID
 
     - **activity_id**: The unique identifier of the activity to delete
+    - **petId**: Optional pet ID; avoids locating the activity's partition first
     """
     try:
-        deleted = db_service.delete_activity(activity_id)
+        deleted = await db_service.delete_activity(activity_id, petId)
         if not deleted:
             raise HTTPException(
                 status_code=404, detail=f"Activity with ID {activity_id} not found")
@@ -242,11 +265,16 @@ async def delete_activity(
 if __name__ == "__main__":
     import uvicorn
 
-    # Start the server
+    # Start the server with the uvloop event loop and httptools HTTP parser (both
+    # installed by uvicorn[standard]). Auto-reload is only used in debug mode;
+    # otherwise requests are spread across worker processes.
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8020,  # Different port from Pet Service
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
         log_level="info"
     )
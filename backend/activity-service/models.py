@@ -7,8 +7,18 @@ and type checking, following Azure CosmosDB best practices.
 
 import uuid
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, timezone
+
+
+def _new_id() -> str:
+    """Generate a new document ID (32-character UUID4 hex, no dashes)"""
+    return uuid.uuid4().hex
+
+
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
 
 
 class ActivityBase(BaseModel):
@@ -34,15 +44,12 @@ class ActivityUpdate(BaseModel):
 
 class Activity(ActivityBase):
     """Complete Activity model with ID and metadata"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique activity identifier")
-    createdAt: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updatedAt: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    id: str = Field(default_factory=_new_id, description="Unique activity identifier")
+    createdAt: datetime = Field(default_factory=_utc_now, description="Creation timestamp")
+    updatedAt: datetime = Field(default_factory=_utc_now, description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Datetimes are serialized to ISO 8601 by pydantic-core, no Python encoder needed
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ActivitySearchFilters(BaseModel):
@@ -52,7 +59,7 @@ class ActivitySearchFilters(BaseModel):
     from_timestamp: Optional[datetime] = Field(None, alias="from", description="Filter activities from this timestamp")
     to_timestamp: Optional[datetime] = Field(None, alias="to", description="Filter activities to this timestamp")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
-    offset: int = Field(0, ge=0, description="Number of results to skip")
+    continuationToken: Optional[str] = Field(None, description="Continuation token returned with the previous page")
 
     class Config:
         populate_by_name = True  # Allow both 'from' and 'from_timestamp'
\ No newline at end of file
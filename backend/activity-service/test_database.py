@@ -0,0 +1,89 @@
+"""
+Tests for ActivityCosmosService search paging, run against a mocked container
+
+Run with: python -m pytest test_database.py -v
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("COSMOS_ENDPOINT", "https://example.documents.azure.com:443/")
+os.environ.setdefault("COSMOS_KEY", "fake_key")
+
+from database import ActivityCosmosService
+from models import ActivitySearchFilters
+
+
+STORED_ACTIVITY = {
+    "id": "act1",
+    "petId": "p1",
+    "type": "walk",
+    "timestamp": "2025-01-01T08:00:00+00:00",
+    "notes": "Morning walk",
+    "createdAt": "2025-01-01T08:00:00+00:00",
+    "updatedAt": "2025-01-01T08:00:00+00:00",
+}
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class _FakePages:
+    """Stand-in for the by_page iterator returned by query_items"""
+
+    def __init__(self, items, continuation_token=None):
+        self.items = items
+        self.continuation_token = continuation_token
+
+    async def __aiter__(self):
+        yield _aiter(self.items)
+
+
+@pytest.fixture
+def service():
+    """Service whose container returns one page holding STORED_ACTIVITY"""
+    svc = ActivityCosmosService("https://example.documents.azure.com:443/", "fake_key")
+    svc.container = MagicMock()
+    svc.container.query_items.return_value.by_page.return_value = _FakePages(
+        [dict(STORED_ACTIVITY)], continuation_token="next-page")
+    svc._initialized = True
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_pet_scoped_search_resumes_from_token_in_one_partition(service):
+    """With a petId the query stays in that partition and pages by continuation token"""
+    filters = ActivitySearchFilters(petId="p1", limit=1, continuationToken="token-1")
+
+    activities, next_token = await service.search_activities(filters)
+
+    assert activities == [STORED_ACTIVITY]
+    assert next_token == "next-page"
+    service.container.query_items.return_value.by_page.assert_called_once_with("token-1")
+    query_kwargs = service.container.query_items.call_args.kwargs
+    assert query_kwargs["partition_key"] == "p1"
+    assert query_kwargs["max_item_count"] == 1
+    assert "OFFSET" not in query_kwargs["query"]
+
+
+@pytest.mark.asyncio
+async def test_cross_partition_search_returns_first_page_without_token(service):
+    """Listings across pets cannot be resumed reliably, so no token is handed out"""
+    activities, next_token = await service.search_activities(ActivitySearchFilters(type="walk"))
+
+    assert activities == [STORED_ACTIVITY]
+    assert next_token is None
+    assert service.container.query_items.call_args.kwargs["partition_key"] is None
+
+
+@pytest.mark.asyncio
+async def test_continuation_token_without_pet_is_rejected(service):
+    """A token is refused before any cross-partition query is resumed from it"""
+    with pytest.raises(ValueError, match="petId"):
+        await service.search_activities(ActivitySearchFilters(continuationToken="token-1"))
+
+    service.container.query_items.assert_not_called()
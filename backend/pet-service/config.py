@@ -6,7 +6,7 @@ following Azure best practices for credential management.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 from functools import lru_cache
 from dotenv import load_dotenv
 
@@ -25,6 +25,12 @@ class Settings:
             "COSMOS_DATABASE_NAME", "petservice")
         self.cosmos_container_name: str = os.getenv(
             "COSMOS_CONTAINER_NAME", "pets")
+        # Comma-separated Azure regions to route requests to first, e.g. "West Europe,North Europe"
+        self.cosmos_preferred_locations: List[str] = [
+            region.strip()
+            for region in os.getenv("COSMOS_PREFERRED_LOCATIONS", "").split(",")
+            if region.strip()
+        ]
 
         # Application Configuration
         self.app_name: str = "Pet Service API"
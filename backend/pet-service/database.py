@@ -9,13 +9,18 @@ Authentication Strategy:
 - Azure Deployment: Uses Entra ID (Managed Identity) authentication
 """
 
+import asyncio
 import logging
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
-from azure.cosmos import CosmosClient, exceptions as cosmos_exceptions, PartitionKey
-from azure.identity import DefaultAzureCredential
+from azure.cosmos import exceptions as cosmos_exceptions, PartitionKey
+from azure.cosmos.aio import CosmosClient
+from azure.core.exceptions import AzureError
+from azure.identity.aio import DefaultAzureCredential
 
 from config import get_settings
 from models import Pet, PetCreate, PetUpdate, PetSearchFilters
@@ -23,6 +28,167 @@ from models import Pet, PetCreate, PetUpdate, PetSearchFilters
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Only the properties search_pets filters or sorts on are indexed (``id`` is always
+# indexed by Cosmos); every other path is excluded to keep write RU and index storage low.
+# This is applied only when the service creates the container itself (e.g. against the
+# emulator); Azure containers are provisioned by infra/main.bicep, which carries a copy
+# that must be kept in sync.
+PET_INDEXING_POLICY: Dict[str, Any] = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [
+        {"path": "/name/?"},
+        {"path": "/notes/?"},
+        {"path": "/species/?"},
+        {"path": "/createdAt/?"},
+    ],
+    "excludedPaths": [{"path": "/*"}],
+}
+
+PET_FIELDS: Tuple[str, ...] = tuple(Pet.model_fields)
+PET_FIELDS_SET = set(PET_FIELDS)
+# Project only the API fields so raw query results match the Pet schema
+PET_PROJECTION = ", ".join(f"c.{field}" for field in PET_FIELDS)
+
+# Sample pets written by _database_seed; timestamps are added at seeding time
+_SEED_PETS: Tuple[Dict[str, Any], ...] = (
+    {
+        "id": "p1",
+        "name": "Luna",
+        "species": "dog",
+        "ageYears": 3,
+        "health": 82,
+        "happiness": 91,
+        "energy": 76,
+        "avatarUrl": "",
+        "notes": "Loves fetch"
+    },
+    {
+        "id": "p2",
+        "name": "Milo",
+        "species": "cat",
+        "ageYears": 2,
+        "health": 88,
+        "happiness": 73,
+        "energy": 65,
+        "avatarUrl": "",
+        "notes": "Window watcher"
+    },
+    {
+        "id": "p3",
+        "name": "Pico",
+        "species": "bird",
+        "ageYears": 1,
+        "health": 75,
+        "happiness": 80,
+        "energy": 90,
+        "avatarUrl": "",
+        "notes": "Chirpy"
+    }
+)
+
+
+def _pet_from_document(document: Dict[str, Any]) -> Pet:
+    """
+    Build a Pet from a document this service stored, skipping validation
+
+    The document was validated when it was written, so only the ISO timestamps are
+    converted back; Cosmos system properties (``_rid``, ``_etag``, ``_ts``, ...) are dropped.
+    """
+    values = {field: document[field] for field in PET_FIELDS if field in document}
+    for field in ("createdAt", "updatedAt"):
+        if isinstance(values.get(field), str):
+            values[field] = datetime.fromisoformat(values[field])
+    return Pet.model_construct(_fields_set=PET_FIELDS_SET, **values)
+
+
+# Bounds for the in-process get_pet cache. Writes in this process refresh or drop their
+# entry; other replicas may serve a stale copy for up to the TTL.
+PET_CACHE_MAX_SIZE = 1024
+PET_CACHE_TTL_SECONDS = 30.0
+
+# Bounds for the in-process search result cache, which is cleared on every write
+SEARCH_CACHE_MAX_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 30.0
+
+
+class _TTLCache:
+    """
+    Small LRU cache whose entries also expire after a fixed time-to-live.
+
+    The accessory service carries the same class: each service image is built from its
+    own directory, so there is no shared module to import it from.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (expiry on the monotonic clock, value)
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or ``None`` when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+def _build_search_query(has_search: bool, has_species: bool) -> str:
+    """Build the search query text for a filter shape"""
+    query_parts = [f"SELECT {PET_PROJECTION} FROM c"]
+    conditions = []
+
+    # Search condition (name or notes) - emulator-compatible version
+    if has_search:
+        conditions.append(
+            "(CONTAINS(c.name, @search) OR CONTAINS(c.notes, @search))")
+
+    # Species filter
+    if has_species:
+        conditions.append("c.species = @species")
+
+    # Add WHERE clause if there are conditions
+    if conditions:
+        query_parts.append("WHERE " + " AND ".join(conditions))
+
+    query_parts.append("ORDER BY c.createdAt DESC")
+    # Paging values are bound as parameters so the text stays the same across pages
+    query_parts.append("OFFSET @offset LIMIT @limit")
+    return " ".join(query_parts)
+
+
+# All four (has_search, has_species) shapes are built up front, leaving a single dict
+# lookup per request; identical query text also lets Cosmos reuse its cached query plan
+_SEARCH_QUERIES: Dict[Tuple[bool, bool], str] = {
+    (has_search, has_species): _build_search_query(has_search, has_species)
+    for has_search in (False, True)
+    for has_species in (False, True)
+}
+
+# Multi-id lookups fetch every uncached pet with one query instead of a read per id
+_IDS_QUERY = f"SELECT {PET_PROJECTION} FROM c WHERE ARRAY_CONTAINS(@ids, c.id)"
+
 
 class CosmosDBService:
     """
@@ -39,7 +205,18 @@ class CosmosDBService:
         self.client: Optional[CosmosClient] = None
         self.database = None
         self.container = None
+        # Kept across client rebuilds (e.g. after clean_database) so its token cache survives
+        self.credential: Optional[DefaultAzureCredential] = None
+        self._cache = _TTLCache(PET_CACHE_MAX_SIZE, PET_CACHE_TTL_SECONDS)
+        # (generation, filter values, raw) -> pets, for searches. Writes bump the
+        # generation, so a search that raced a write can only cache its result under a
+        # key that is never looked up again.
+        self._search_cache = _TTLCache(SEARCH_CACHE_MAX_SIZE, SEARCH_CACHE_TTL_SECONDS)
+        self._search_generation = 0
         self._initialized = False
+        # Set once a health check has reached the container; later checks answer from
+        # memory until a Cosmos call fails with a server, not-found or connection error
+        self._healthy = False
 
     def _build_cosmos_client_options(self) -> Dict[str, Any]:
         """
@@ -51,10 +228,15 @@ class CosmosDBService:
         """
         options: Dict[str, Any] = {
             "url": self.settings.cosmos_endpoint,
+            # Note: the legacy ``request_timeout`` option is in milliseconds and would
+            # override this value, so only ``connection_timeout`` is set
             "connection_timeout": 30,
-            "request_timeout": 30,
         }
 
+        if self.settings.cosmos_preferred_locations and not self.settings.is_local:
+            # Route requests to the nearest replica instead of the account's write region
+            options["preferred_locations"] = self.settings.cosmos_preferred_locations
+
         if self.settings.is_local:
             # Local development: Use key-based authentication
             logger.info("Using key-based authentication (local development)")
@@ -72,8 +254,9 @@ class CosmosDBService:
             # Azure deployment: Use Entra ID (Managed Identity) authentication
             logger.info(
                 "Using Entra ID authentication (Azure deployment with Managed Identity)")
-            credential = DefaultAzureCredential()
-            options["credential"] = credential
+            if self.credential is None:
+                self.credential = DefaultAzureCredential()
+            options["credential"] = self.credential
 
         return options
 
@@ -93,15 +276,15 @@ class CosmosDBService:
             logger.info(
                 f"Initializing CosmosDB connection with {auth_type} authentication")
 
-            cosmos_client_options = self._build_cosmos_client_options()
-            endpoint = cosmos_client_options["url"]
-
-            if endpoint.startswith("http://") and not self.settings.is_local:
-                logger.warning(
-                    "COSMOS_ENDPOINT is using http:// in production – consider switching to https://")
+            endpoint = self.settings.cosmos_endpoint
+            # clean_database keeps the client, so only the first call builds one
+            if self.client is None:
+                if endpoint.startswith("http://") and not self.settings.is_local:
+                    logger.warning(
+                        "COSMOS_ENDPOINT is using http:// in production – consider switching to https://")
 
-            self.client = CosmosClient(**cosmos_client_options)
-            logger.info(f"Connected to CosmosDB endpoint: {endpoint}")
+                self.client = CosmosClient(**self._build_cosmos_client_options())
+                logger.info(f"Connected to CosmosDB endpoint: {endpoint}")
 
             # Get database and container references
             self.database = self.client.get_database_client(
@@ -117,30 +300,61 @@ class CosmosDBService:
             logger.error(f"Failed to initialize CosmosDB client: {e}")
             raise
 
+    async def startup(self) -> Dict[str, Any]:
+        """
+        Initialize the service once before it serves traffic
+
+        Builds the client, database and container proxies, then runs the health check
+        to warm the SDK's connection and metadata caches. Building the proxies makes no
+        network calls, so later operations find them in place even when CosmosDB is
+        unreachable at startup.
+        """
+        self._ensure_initialized()
+        return await self.health_check()
+
+    def _invalidate_health(self, error: Exception) -> None:
+        """Make the next health check probe Cosmos again after a failed call"""
+        if isinstance(error, cosmos_exceptions.CosmosHttpResponseError):
+            if error.status_code is not None and (error.status_code >= 500 or error.status_code == 404):
+                self._healthy = False
+        elif isinstance(error, AzureError):
+            # Connection and timeout failures
+            self._healthy = False
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Health check for the CosmosDB connection
 
-        If database or container doesn't exist, creates them and seeds with sample data
+        If database or container doesn't exist, creates them and seeds with sample data.
+        Once the container has been reached, repeated checks skip the probe query until
+        a Cosmos call fails (see ``_invalidate_health``).
         """
+        if self._healthy:
+            return {"status": "healthy", "database": self.settings.cosmos_database_name}
+
         try:
             # Ensure client is initialized
             self._ensure_initialized()
 
             # Try to perform a simple query to verify connection
             try:
-                items = list(self.container.query_items(
+                # Only the first item matters; don't drain the iterator
+                first_item = None
+                async for item in self.container.query_items(
                     query="SELECT TOP 1 c.id FROM c",
-                    enable_cross_partition_query=True,
                     max_item_count=1
-                ))
+                ):
+                    first_item = item
+                    break
 
-                if items:
+                if first_item is not None:
+                    self._healthy = True
                     return {"status": "healthy", "database": self.settings.cosmos_database_name}
 
                 logger.info(
                     "Database is reachable but empty. Seeding with sample data...")
                 await self._database_seed()
+                self._healthy = True
                 return {
                     "status": "healthy",
                     "database": self.settings.cosmos_database_name,
@@ -154,6 +368,7 @@ class CosmosDBService:
                     logger.info(
                         "Database or container not found. Creating and seeding with sample data...")
                     await self._create_database_and_seed()
+                    self._healthy = True
                     return {
                         "status": "healthy",
                         "database": self.settings.cosmos_database_name,
@@ -173,16 +388,17 @@ class CosmosDBService:
             # Create database if it doesn't exist
             logger.info(
                 f"Creating database: {self.settings.cosmos_database_name}")
-            database = self.client.create_database_if_not_exists(
+            database = await self.client.create_database_if_not_exists(
                 id=self.settings.cosmos_database_name
             )
 
             # Create container if it doesn't exist
             logger.info(
                 f"Creating container: {self.settings.cosmos_container_name}")
-            container = database.create_container_if_not_exists(
+            container = await database.create_container_if_not_exists(
                 id=self.settings.cosmos_container_name,
-                partition_key=PartitionKey(path="/id"),
+                partition_key=PartitionKey(path="/species"),
+                indexing_policy=PET_INDEXING_POLICY,
                 offer_throughput=400  # Minimum RU/s for manual throughput
             )
 
@@ -193,6 +409,7 @@ class CosmosDBService:
                 self.settings.cosmos_container_name)
 
             await self._database_seed()
+            self._invalidate_searches()
             logger.info("Database setup and seeding completed successfully")
 
         except Exception as e:
@@ -206,57 +423,47 @@ class CosmosDBService:
                 "Cosmos container is not initialized; cannot seed database")
 
         logger.info("Seeding container with sample pet data")
-        sample_pets = [
-            {
-                "id": "p1",
-                "name": "Luna",
-                "species": "dog",
-                "ageYears": 3,
-                "health": 82,
-                "happiness": 91,
-                "energy": 76,
-                "avatarUrl": "",
-                "notes": "Loves fetch",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
-            },
-            {
-                "id": "p2",
-                "name": "Milo",
-                "species": "cat",
-                "ageYears": 2,
-                "health": 88,
-                "happiness": 73,
-                "energy": 65,
-                "avatarUrl": "",
-                "notes": "Window watcher",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
-            },
-            {
-                "id": "p3",
-                "name": "Pico",
-                "species": "bird",
-                "ageYears": 1,
-                "health": 75,
-                "happiness": 80,
-                "energy": 90,
-                "avatarUrl": "",
-                "notes": "Chirpy",
-                "createdAt": datetime.utcnow().isoformat(),
-                "updatedAt": datetime.utcnow().isoformat()
-            }
+        # One timestamp for the whole batch; the static fields live in _SEED_PETS
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        seed_pets = [
+            {**seed_pet, "createdAt": now_iso, "updatedAt": now_iso} for seed_pet in _SEED_PETS
         ]
 
-        for pet_data in sample_pets:
-            try:
-                self.container.create_item(body=pet_data)
-                logger.info(
-                    f"Seeded pet: {pet_data['name']} ({pet_data['id']})")
-            except cosmos_exceptions.CosmosResourceExistsError:
-                logger.info(
-                    f"Pet {pet_data['name']} ({pet_data['id']}) already exists, skipping")
-                continue
+        # Transactional batches are scoped to one partition, so group seeds by species
+        pets_by_species: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for pet_data in seed_pets:
+            pets_by_species[pet_data["species"]].append(pet_data)
+
+        # Partitions are independent, so their batches are submitted concurrently
+        await asyncio.gather(*(
+            self._seed_partition(species, pets)
+            for species, pets in pets_by_species.items()
+        ))
+
+    async def _seed_partition(self, species: str, pets: List[Dict[str, Any]]) -> None:
+        """Seed the pets of one species as a single transactional batch."""
+        try:
+            await self.container.execute_item_batch(
+                batch_operations=[("create", (pet_data,)) for pet_data in pets],
+                partition_key=species,
+            )
+            logger.info(f"Seeded {len(pets)} pets of species {species}")
+        except cosmos_exceptions.CosmosBatchOperationError:
+            # The batch is all-or-nothing; retry item by item to skip existing ones
+            results = await asyncio.gather(
+                *(self.container.create_item(body=pet_data) for pet_data in pets),
+                return_exceptions=True,
+            )
+            for pet_data, result in zip(pets, results):
+                if isinstance(result, cosmos_exceptions.CosmosResourceExistsError):
+                    logger.info(
+                        f"Pet {pet_data['name']} ({pet_data['id']}) already exists, skipping")
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    logger.info(
+                        f"Seeded pet: {pet_data['name']} ({pet_data['id']})")
 
     async def clean_database(self) -> Dict[str, Any]:
         """Delete configured CosmosDB database and reset local references."""
@@ -269,7 +476,7 @@ class CosmosDBService:
                 self.client = CosmosClient(**cosmos_client_options)
 
             try:
-                self.client.delete_database(database_id)
+                await self.client.delete_database(database_id)
                 logger.info(
                     f"Deleted CosmosDB database '{database_id}' and all containers")
             except cosmos_exceptions.CosmosResourceNotFoundError:
@@ -280,11 +487,14 @@ class CosmosDBService:
                     f"CosmosDB HTTP error deleting database '{database_id}': {e}")
                 raise
 
-            # Reset internal state so future operations perform a fresh setup.
-            self.client = None
+            # Reset internal state so future operations perform a fresh setup; the
+            # client (and its connection pool and credential) stays usable.
             self.database = None
             self.container = None
             self._initialized = False
+            self._healthy = False
+            self._cache.clear()
+            self._invalidate_searches()
 
             return {
                 "status": "clean",
@@ -301,7 +511,7 @@ class CosmosDBService:
                 "error": str(e)
             }
 
-    def create_pet(self, pet_data: PetCreate) -> Pet:
+    async def create_pet(self, pet_data: PetCreate) -> Pet:
         """
         Create a new pet in CosmosDB
 
@@ -317,221 +527,408 @@ class CosmosDBService:
         try:
             # Ensure client is initialized
             self._ensure_initialized()
-            # Create Pet object with generated ID and timestamps
-            pet = Pet(**pet_data.model_dump())
-            pet_dict = pet.model_dump()
-
-            # Convert datetime objects to ISO strings for CosmosDB
-            pet_dict['createdAt'] = pet.createdAt.isoformat()
-            pet_dict['updatedAt'] = pet.updatedAt.isoformat()
+            # PetCreate is already validated; model_construct only fills in the
+            # generated ID. Both timestamps come from one clock read, so a new pet's
+            # createdAt and updatedAt are identical.
+            values = pet_data.model_dump()
+            now = datetime.now(timezone.utc)
+            pet = Pet.model_construct(
+                _fields_set=PET_FIELDS_SET, createdAt=now, updatedAt=now, **values)
+
+            # Cosmos stores the timestamps as ISO strings
+            now_iso = now.isoformat()
+            pet_dict = {
+                **values,
+                "id": pet.id,
+                "createdAt": now_iso,
+                "updatedAt": now_iso,
+            }
 
-            # Insert into CosmosDB
-            response = self.container.create_item(body=pet_dict)
+            # Insert into CosmosDB; the stored document is what we sent, so the local
+            # Pet is returned instead of re-parsing the response
+            await self.container.create_item(body=pet_dict)
             logger.info(f"Created pet with ID: {pet.id}")
+            self._cache.put(pet.id, pet)
+            self._invalidate_searches()
 
-            return Pet(**response)
+            return pet
 
         except cosmos_exceptions.CosmosResourceExistsError:
             logger.error(f"Pet with ID {pet.id} already exists")
             raise ValueError(f"Pet with ID {pet.id} already exists")
         except cosmos_exceptions.CosmosHttpResponseError as e:
+            self._invalidate_health(e)
             logger.error(f"CosmosDB HTTP error creating pet: {e}")
             raise
         except Exception as e:
+            self._invalidate_health(e)
             logger.error(f"Unexpected error creating pet: {e}")
             raise
 
-    def get_pet(self, pet_id: str) -> Optional[Pet]:
+    def _invalidate_searches(self) -> None:
+        """Forget cached search results after a write."""
+        self._search_generation += 1
+        self._search_cache.clear()
+
+    async def _read_pet_item(self, pet_id: str, species: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read the raw pet document
+
+        The container is partitioned by ``/species``. When the caller knows the species,
+        this is a single-partition point read; otherwise the item is located with an id query.
+
+        Args:
+            pet_id: Pet identifier
+            species: The pet's species (partition key), if known
+
+        Returns:
+            The stored document, or None if not found
+        """
+        if species:
+            try:
+                return await self.container.read_item(item=pet_id, partition_key=species)
+            except cosmos_exceptions.CosmosResourceNotFoundError:
+                return None
+
+        async for item in self.container.query_items(
+            query="SELECT * FROM c WHERE c.id = @id",
+            parameters=[{"name": "@id", "value": pet_id}],
+            max_item_count=1
+        ):
+            return item
+        return None
+
+    async def get_pet(self, pet_id: str, species: Optional[str] = None) -> Optional[Pet]:
         """
         Get a pet by ID
 
         Args:
             pet_id: Pet identifier
+            species: The pet's species (partition key), if known
 
         Returns:
             Pet object if found, None otherwise
         """
+        cached = self._cache.get(pet_id)
+        if cached is not None and (not species or cached.species == species):
+            return cached
+
         try:
             # Ensure client is initialized
             self._ensure_initialized()
-            response = self.container.read_item(
-                item=pet_id, partition_key=pet_id)
-            return Pet(**response)
+            response = await self._read_pet_item(pet_id, species)
+            if response is None:
+                logger.info(f"Pet not found: {pet_id}")
+                return None
+            pet = _pet_from_document(response)
+            self._cache.put(pet.id, pet)
+            return pet
 
-        except cosmos_exceptions.CosmosResourceNotFoundError:
-            logger.info(f"Pet not found: {pet_id}")
-            return None
         except cosmos_exceptions.CosmosHttpResponseError as e:
+            self._invalidate_health(e)
             logger.error(f"CosmosDB HTTP error getting pet {pet_id}: {e}")
             raise
         except Exception as e:
+            self._invalidate_health(e)
             logger.error(f"Unexpected error getting pet {pet_id}: {e}")
             raise
 
-    def update_pet(self, pet_id: str, update_data: PetUpdate) -> Optional[Pet]:
+    async def get_pets_by_ids(self, pet_ids: List[str]) -> List[Pet]:
         """
-        Update a pet by ID
+        Get several pets by ID in one call
+
+        Cached pets are answered from memory; the rest are fetched together with a
+        single query. Pets live in their species partition, so without the species a
+        read per id would be a cross-partition query each.
+
+        Args:
+            pet_ids: Pet identifiers
+
+        Returns:
+            The pets that were found, in the order their IDs were given
+        """
+        found: Dict[str, Pet] = {}
+        missing = []
+        for pet_id in dict.fromkeys(pet_ids):
+            cached = self._cache.get(pet_id)
+            if cached is not None:
+                found[pet_id] = cached
+            else:
+                missing.append(pet_id)
+
+        if missing:
+            try:
+                # Ensure client is initialized
+                self._ensure_initialized()
+                async for item in self.container.query_items(
+                    query=_IDS_QUERY,
+                    parameters=[{"name": "@ids", "value": missing}],
+                    max_item_count=len(missing)
+                ):
+                    pet = _pet_from_document(item)
+                    self._cache.put(pet.id, pet)
+                    found[pet.id] = pet
+
+            except cosmos_exceptions.CosmosHttpResponseError as e:
+                self._invalidate_health(e)
+                logger.error(f"CosmosDB HTTP error getting pets {missing}: {e}")
+                raise
+            except Exception as e:
+                self._invalidate_health(e)
+                logger.error(f"Unexpected error getting pets {missing}: {e}")
+                raise
+
+        logger.info(f"Found {len(found)} of {len(pet_ids)} requested pets")
+        return [found[pet_id] for pet_id in dict.fromkeys(pet_ids) if pet_id in found]
+
+    async def update_pet(
+        self, pet_id: str, update_data: PetUpdate, species: Optional[str] = None
+    ) -> Optional[Pet]:
+        """
+        Update a pet by ID using a Cosmos partial-document patch
+
+        Only the changed fields (plus ``updatedAt``) are sent. When the species is
+        known and unchanged no read is needed before the write; changing the species
+        moves the document to its new partition. An empty update is answered with a
+        plain read.
 
         Args:
             pet_id: Pet identifier
             update_data: Pet update data
+            species: The pet's current species (partition key), if known
 
         Returns:
             Updated Pet object if successful, None if not found
         """
+        update_dict = update_data.model_dump(mode="json", exclude_unset=True)
+        if not update_dict:
+            return await self.get_pet(pet_id, species)  # No changes
+
+        self._cache.pop(pet_id)
         try:
             # Ensure client is initialized
             self._ensure_initialized()
-            # Get existing pet
-            existing_pet = self.get_pet(pet_id)
-            if not existing_pet:
-                return None
-
-            # Apply updates
-            update_dict = update_data.model_dump(exclude_unset=True)
-            if not update_dict:
-                return existing_pet  # No changes
 
-            # Update the existing pet data (with JSON serialization)
-            pet_dict = existing_pet.model_dump(mode='json')
-            pet_dict.update(update_dict)
-            pet_dict['updatedAt'] = datetime.utcnow().isoformat()
-
-            # Update in CosmosDB
-            response = self.container.replace_item(item=pet_id, body=pet_dict)
-            logger.info(f"Updated pet: {pet_id}")
-
-            return Pet(**response)
+            existing_item = None
+            if not species or update_dict.get("species", species) != species:
+                existing_item = await self._read_pet_item(pet_id, species)
+                if existing_item is None:
+                    logger.info(f"Pet not found for update: {pet_id}")
+                    return None
+                species = existing_item["species"]
+
+            updated_at = datetime.now(timezone.utc).isoformat()
+
+            if update_dict.get("species", species) != species:
+                # The partition key cannot be patched, so the pet is recreated in the
+                # new species partition and removed from the old one
+                pet_dict = {field: existing_item[field]
+                            for field in PET_FIELDS if field in existing_item}
+                pet_dict.update(update_dict)
+                pet_dict["updatedAt"] = updated_at
+
+                response = await self.container.create_item(body=pet_dict)
+                try:
+                    await self.container.delete_item(item=pet_id, partition_key=species)
+                except Exception:
+                    # The move is two separate writes; rather than leave the pet in both
+                    # partitions, remove the new copy before surfacing the error
+                    logger.error(
+                        f"Failed to remove pet {pet_id} from species {species} while moving "
+                        f"it to {pet_dict['species']}; rolling back")
+                    try:
+                        await self.container.delete_item(
+                            item=pet_id, partition_key=pet_dict["species"])
+                    except Exception as rollback_error:
+                        logger.error(
+                            f"Rollback failed; pet {pet_id} now exists under both species "
+                            f"{species} and {pet_dict['species']}: {rollback_error}")
+                    raise
+                logger.info(
+                    f"Moved pet {pet_id} from species {species} to {pet_dict['species']}")
+            else:
+                # The partition key path cannot be patched, even to its current value
+                update_dict.pop("species", None)
+                patch_operations = [
+                    {"op": "set", "path": f"/{field}", "value": value}
+                    for field, value in update_dict.items()
+                ]
+                patch_operations.append(
+                    {"op": "set", "path": "/updatedAt", "value": updated_at})
+
+                response = await self.container.patch_item(
+                    item=pet_id,
+                    partition_key=species,
+                    patch_operations=patch_operations
+                )
+                logger.info(f"Updated pet: {pet_id}")
+
+            updated = _pet_from_document(response)
+            self._cache.put(updated.id, updated)
+            self._invalidate_searches()
+            return updated
 
         except cosmos_exceptions.CosmosResourceNotFoundError:
             logger.info(f"Pet not found for update: {pet_id}")
             return None
         except cosmos_exceptions.CosmosHttpResponseError as e:
+            self._invalidate_health(e)
             logger.error(f"CosmosDB HTTP error updating pet {pet_id}: {e}")
             raise
         except Exception as e:
+            self._invalidate_health(e)
             logger.error(f"Unexpected error updating pet {pet_id}: {e}")
             raise
 
-    def delete_pet(self, pet_id: str) -> bool:
+    async def delete_pet(self, pet_id: str, species: Optional[str] = None) -> bool:
         """
         Delete a pet by ID
 
         Args:
             pet_id: Pet identifier
+            species: The pet's species (partition key), if known
 
         Returns:
             True if deleted, False if not found
         """
+        self._cache.pop(pet_id)
         try:
             # Ensure client is initialized
             self._ensure_initialized()
-            self.container.delete_item(item=pet_id, partition_key=pet_id)
+            if not species:
+                existing_item = await self._read_pet_item(pet_id)
+                if existing_item is None:
+                    logger.info(f"Pet not found for deletion: {pet_id}")
+                    return False
+                species = existing_item["species"]
+
+            await self.container.delete_item(item=pet_id, partition_key=species)
             logger.info(f"Deleted pet: {pet_id}")
+            self._invalidate_searches()
             return True
 
         except cosmos_exceptions.CosmosResourceNotFoundError:
             logger.info(f"Pet not found for deletion: {pet_id}")
             return False
         except cosmos_exceptions.CosmosHttpResponseError as e:
+            self._invalidate_health(e)
             logger.error(f"CosmosDB HTTP error deleting pet {pet_id}: {e}")
             raise
         except Exception as e:
+            self._invalidate_health(e)
             logger.error(f"Unexpected error deleting pet {pet_id}: {e}")
             raise
 
-    async def search_pets(self, filters: PetSearchFilters) -> List[Pet]:
+    def _query_pets(self, filters: PetSearchFilters):
+        """Start the search query; pages are fetched lazily as the results are consumed."""
+        query = _SEARCH_QUERIES[bool(filters.search), bool(filters.species)]
+
+        parameters = [
+            {"name": "@offset", "value": filters.offset},
+            {"name": "@limit", "value": filters.limit},
+        ]
+        if filters.search:
+            parameters.append({"name": "@search", "value": filters.search})
+        if filters.species:
+            parameters.append(
+                {"name": "@species", "value": filters.species})
+
+        logger.debug(
+            f"Executing query: {query} with parameters: {parameters}")
+
+        # A species filter scopes the query to that single partition
+        return self.container.query_items(
+            query=query,
+            parameters=parameters,
+            partition_key=filters.species,
+            max_item_count=filters.limit
+        )
+
+    async def search_pets(self, filters: PetSearchFilters, raw: bool = False) -> List[Any]:
         """
         Search pets with filtering support
 
         Args:
             filters: Search and filter parameters
+            raw: Return the projected Cosmos documents as plain dicts, skipping
+                timestamp parsing and model construction for callers that only
+                serialize them
 
         Returns:
-            List of Pet objects matching the criteria
+            List of Pet objects (or dicts) matching the criteria
+
+        Results are cached for a short time per filter combination and dropped on any
+        write made through this service. The cache keeps its own immutable copy of each
+        result, and every call gets a new list.
         """
+        cache_key = (
+            self._search_generation,
+            filters.search,
+            filters.species,
+            filters.limit,
+            filters.offset,
+            raw,
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             # Ensure client is initialized
             self._ensure_initialized()
-            # Build SQL query based on filters
-            query_parts = ["SELECT * FROM c"]
-            parameters = []
-            conditions = []
-
-            # Add search condition (name or notes) - emulator-compatible version
-            if filters.search:
-                conditions.append(
-                    "(CONTAINS(c.name, @search) OR CONTAINS(c.notes, @search))")
-                parameters.append({"name": "@search", "value": filters.search})
-
-            # Add species filter
-            if filters.species:
-                conditions.append("c.species = @species")
-                parameters.append(
-                    {"name": "@species", "value": filters.species})
-
-            # Add WHERE clause if there are conditions
-            if conditions:
-                query_parts.append("WHERE " + " AND ".join(conditions))
-
-            # Add ordering and pagination
-            query_parts.append("ORDER BY c.createdAt DESC")
-            query_parts.append(
-                f"OFFSET {filters.offset} LIMIT {filters.limit}")
-
-            query = " ".join(query_parts)
-            logger.debug(
-                f"Executing query: {query} with parameters: {parameters}")
-
-            # Execute query
-            items = list(self.container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True,
-                max_item_count=filters.limit
-            ))
-
-            # Convert to Pet objects
+            items = self._query_pets(filters)
+
+            if raw:
+                pets = [item async for item in items]
+                logger.info(f"Found {len(pets)} pets matching criteria")
+                self._search_cache.put(cache_key, tuple(pets))
+                return pets
+
+            # Convert to Pet objects as they arrive instead of buffering the documents
             pets = []
-            for item in items:
+            async for item in items:
                 try:
-                    pets.append(Pet(**item))
+                    pets.append(_pet_from_document(item))
                 except Exception as e:
                     logger.warning(f"Failed to parse pet item: {e}")
                     continue
 
             logger.info(f"Found {len(pets)} pets matching criteria")
+            self._search_cache.put(cache_key, tuple(pets))
             return pets
 
         except (cosmos_exceptions.CosmosResourceNotFoundError, cosmos_exceptions.CosmosHttpResponseError) as e:
             # Database or container doesn't exist - check if it's a "not found" type error
             error_message = str(e).lower()
             if "does not exist" in error_message or "notfound" in error_message or e.status_code in [404, 500]:
+                self._healthy = False
                 logger.info(
                     "Database or container not found during search. Creating and seeding with sample data...")
                 await self._create_database_and_seed()
                 # Retry the search after creating the database
-                return await self.search_pets(filters)
+                return await self.search_pets(filters, raw)
             else:
+                self._invalidate_health(e)
                 logger.error(f"CosmosDB HTTP error searching pets: {e}")
                 raise
         except Exception as e:
+            self._invalidate_health(e)
             logger.error(f"Unexpected error searching pets: {e}")
             raise
 
-    async def get_all_pets(self, limit: int = 100, offset: int = 0) -> List[Pet]:
-        """
-        Get all pets with pagination
+    async def close(self) -> None:
+        """Close the CosmosDB client and credential, releasing pooled connections"""
+        if self.client is not None:
+            await self.client.close()
+        if self.credential is not None:
+            await self.credential.close()
 
-        Args:
-            limit: Maximum number of pets to return
-            offset: Number of pets to skip
-
-        Returns:
-            List of Pet objects
-        """
-        filters = PetSearchFilters(limit=limit, offset=offset)
-        return await self.search_pets(filters)
+        self.client = None
+        self.credential = None
+        self.database = None
+        self.container = None
+        self._initialized = False
+        self._healthy = False
 
 
 # Singleton instance
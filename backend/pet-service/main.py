@@ -11,7 +11,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from config import get_settings
 from models import Pet, PetCreate, PetUpdate, PetSearchFilters
@@ -29,12 +29,20 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting Pet Service API")
-    logger.info("CosmosDB connection will be established when first needed")
+
+    # Build the shared client and warm its connection and metadata caches before
+    # serving traffic, so the first user request does not pay for them
+    cosmos_health = await get_cosmos_service().startup()
+    if cosmos_health.get("status") != "healthy":
+        logger.warning(
+            f"CosmosDB warm-up failed, will retry on first request: {cosmos_health.get('error')}")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Pet Service API")
+    # Release the async client's aiohttp session and pooled connections
+    await get_cosmos_service().close()
 
 
 # Initialize FastAPI app
@@ -43,7 +51,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Pet management API with Azure CosmosDB backend",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -62,6 +71,21 @@ def get_db() -> CosmosDBService:
     return get_cosmos_service()
 
 
+# Upper bound on the IDs a single GET /api/pets?ids=... request may ask for
+MAX_IDS_PER_REQUEST = 100
+
+
+def parse_pet_ids(ids: str) -> List[str]:
+    """Split the comma-separated ``ids`` query parameter, rejecting oversized lookups"""
+    pet_ids = [pet_id.strip() for pet_id in ids.split(",") if pet_id.strip()]
+    if len(pet_ids) > MAX_IDS_PER_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_IDS_PER_REQUEST} IDs can be requested at once"
+        )
+    return pet_ids
+
+
 # Exception handlers
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc: ValueError):
@@ -142,11 +166,14 @@ async def get_pets(
         None, description="Search term for name or notes"),
     species: Optional[str] = Query(
         None, description="Filter by species (dog, cat, bird, other)"),
-    status: Optional[str] = Query(
-        None, description="Filter by status (reserved for future use)"),
+    # Named status_filter so it does not shadow fastapi.status inside the handler
+    status_filter: Optional[str] = Query(
+        None, alias="status", description="Filter by status (reserved for future use)"),
     limit: int = Query(100, ge=1, le=1000,
                        description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    ids: Optional[str] = Query(
+        None, description="Comma-separated pet IDs to fetch in one call; other filters are ignored"),
     db: CosmosDBService = Depends(get_db)
 ):
     """
@@ -157,8 +184,14 @@ async def get_pets(
     - **status**: Reserved for future use
     - **limit**: Maximum number of results (1-1000)
     - **offset**: Number of results to skip for pagination
+    - **ids**: Fetch these pets (up to 100) in one call instead of searching
     """
     try:
+        if ids is not None:
+            pets = await db.get_pets_by_ids(parse_pet_ids(ids))
+            logger.info(f"Retrieved {len(pets)} pets by ID")
+            return pets
+
         # Validate species filter
         if species and species not in ["dog", "cat", "bird", "other"]:
             raise HTTPException(
@@ -166,22 +199,24 @@ async def get_pets(
                 detail="Invalid species. Must be one of: dog, cat, bird, other"
             )
 
-        # Create search filters
-        filters = PetSearchFilters(
+        # Create search filters; the query parameters were already validated above
+        # and by FastAPI, so the model is built without validating them again
+        filters = PetSearchFilters.model_construct(
             search=search,
             species=species,
-            status=status,
+            status=status_filter,
             limit=limit,
             offset=offset
         )
 
         logger.info(f"Searching pets with filters: {filters.model_dump()}")
-        # Search pets
-        pets = await db.search_pets(filters)
+        # Documents are already projected to the Pet schema, so they are serialized
+        # as-is instead of being built into models and re-validated by FastAPI.
+        pets = await db.search_pets(filters, raw=True)
 
         logger.info(
             f"Retrieved {len(pets)} pets with filters: {filters.model_dump()}")
-        return pets
+        return ORJSONResponse(content=pets)
 
     except HTTPException:
         raise
@@ -194,7 +229,7 @@ async def get_pets(
 
 
 @app.post("/api/pets", response_model=Pet, status_code=status.HTTP_201_CREATED, tags=["Pets"])
-def create_pet(
+async def create_pet(
     pet_data: PetCreate,
     db: CosmosDBService = Depends(get_db)
 ):
@@ -211,7 +246,7 @@ def create_pet(
     - **notes**: Additional notes about the pet (optional)
     """
     try:
-        pet = db.create_pet(pet_data)
+        pet = await db.create_pet(pet_data)
         logger.info(f"Created new pet: {pet.id}")
         return pet
 
@@ -229,17 +264,20 @@ def create_pet(
 
 
 @app.get("/api/pets/{pet_id}", response_model=Pet, tags=["Pets"])
-def get_pet(
+async def get_pet(
     pet_id: str,
+    species: Optional[str] = Query(
+        None, description="Pet species (partition key) for a single-partition point read"),
     db: CosmosDBService = Depends(get_db)
 ):
     """
     Get a specific pet by ID
 
     - **pet_id**: Unique pet identifier
+    - **species**: Optional pet species; makes the lookup a cheaper point read
     """
     try:
-        pet = db.get_pet(pet_id)
+        pet = await db.get_pet(pet_id, species)
         if not pet:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -259,19 +297,22 @@ def get_pet(
 
 
 @app.patch("/api/pets/{pet_id}", response_model=Pet, tags=["Pets"])
-def update_pet(
+async def update_pet(
     pet_id: str,
     update_data: PetUpdate,
+    species: Optional[str] = Query(
+        None, description="Current pet species (partition key) to skip the lookup before updating"),
     db: CosmosDBService = Depends(get_db)
 ):
     """
     Update a pet by ID (partial update)
 
     - **pet_id**: Unique pet identifier
+    - **species**: Optional pet species; avoids locating the pet's partition first
     - **Update fields**: Any combination of pet fields to update
     """
     try:
-        pet = db.update_pet(pet_id, update_data)
+        pet = await db.update_pet(pet_id, update_data, species)
         if not pet:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -292,17 +333,20 @@ def update_pet(
 
 
 @app.delete("/api/pets/{pet_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Pets"])
-def delete_pet(
+async def delete_pet(
     pet_id: str,
+    species: Optional[str] = Query(
+        None, description="Pet species (partition key) to skip the lookup before deleting"),
     db: CosmosDBService = Depends(get_db)
 ):
     """
     Delete a pet by ID
 
     - **pet_id**: Unique pet identifier
+    - **species**: Optional pet species; avoids locating the pet's partition first
     """
     try:
-        deleted = db.delete_pet(pet_id)
+        deleted = await db.delete_pet(pet_id, species)
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
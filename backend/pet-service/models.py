@@ -7,8 +7,18 @@ and type checking, following Azure CosmosDB best practices.
 
 import uuid
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, timezone
+
+
+def _new_id() -> str:
+    """Generate a new document ID (32-character UUID4 hex, no dashes)"""
+    return uuid.uuid4().hex
+
+
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
 
 
 class PetBase(BaseModel):
@@ -42,15 +52,12 @@ class PetUpdate(BaseModel):
 
 class Pet(PetBase):
     """Complete Pet model with ID and metadata"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique pet identifier")
-    createdAt: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updatedAt: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
-
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    id: str = Field(default_factory=_new_id, description="Unique pet identifier")
+    createdAt: datetime = Field(default_factory=_utc_now, description="Creation timestamp")
+    updatedAt: datetime = Field(default_factory=_utc_now, description="Last update timestamp")
+
+    # Datetimes are serialized to ISO 8601 by pydantic-core, no Python encoder needed
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PetSearchFilters(BaseModel):
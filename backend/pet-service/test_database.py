@@ -0,0 +1,152 @@
+"""
+Test suite for CosmosDBService update and search paths, run against a mocked container
+
+Run with: python -m pytest test_database.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from azure.cosmos import exceptions as cosmos_exceptions
+
+from database import CosmosDBService, _TTLCache
+from models import PetCreate, PetSearchFilters, PetUpdate
+
+
+STORED_PET = {
+    "id": "p1",
+    "name": "Luna",
+    "species": "dog",
+    "ageYears": 3,
+    "health": 82,
+    "happiness": 91,
+    "energy": 74,
+    "avatarUrl": None,
+    "notes": "Loves fetch",
+    "createdAt": "2025-01-01T00:00:00+00:00",
+    "updatedAt": "2025-01-01T00:00:00+00:00",
+    "_etag": "\"etag-1\"",
+}
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def service():
+    """Service wired to a mocked container whose queries return STORED_PET"""
+    svc = CosmosDBService()
+    svc.container = AsyncMock()
+    svc._initialized = True
+    svc._query_pets = MagicMock(side_effect=lambda filters: _aiter([dict(STORED_PET)]))
+    return svc
+
+
+class TestUpdatePet:
+    """Test the patch and species-move paths of update_pet"""
+
+    @pytest.mark.asyncio
+    async def test_update_with_known_species_patches_without_reading(self, service):
+        """With the species hint the update is a single patch in that partition"""
+        service.container.patch_item.return_value = {**STORED_PET, "health": 50}
+
+        updated = await service.update_pet("p1", PetUpdate(health=50), "dog")
+
+        assert updated.health == 50
+        service.container.read_item.assert_not_called()
+        kwargs = service.container.patch_item.call_args.kwargs
+        assert kwargs["partition_key"] == "dog"
+        assert {"op": "set", "path": "/health", "value": 50} in kwargs["patch_operations"]
+
+    @pytest.mark.asyncio
+    async def test_species_change_moves_pet_to_new_partition(self, service):
+        """Changing the partition key re-creates the pet and deletes the old copy"""
+        service.container.read_item.return_value = dict(STORED_PET)
+        service.container.create_item.side_effect = lambda body: body
+
+        updated = await service.update_pet("p1", PetUpdate(species="cat"), "dog")
+
+        assert updated.species == "cat"
+        created = service.container.create_item.call_args.kwargs["body"]
+        assert created["id"] == "p1" and created["species"] == "cat"
+        assert "_etag" not in created
+        service.container.delete_item.assert_awaited_once_with(item="p1", partition_key="dog")
+        service.container.patch_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_species_change_rolls_back_when_old_copy_cannot_be_deleted(self, service):
+        """A failed delete removes the new copy again instead of leaving a duplicate"""
+        service.container.read_item.return_value = dict(STORED_PET)
+        service.container.create_item.side_effect = lambda body: body
+        service.container.delete_item.side_effect = [
+            cosmos_exceptions.CosmosHttpResponseError(status_code=503, message="Unavailable"),
+            None,
+        ]
+
+        with pytest.raises(cosmos_exceptions.CosmosHttpResponseError):
+            await service.update_pet("p1", PetUpdate(species="cat"), "dog")
+
+        deletes = [call.kwargs for call in service.container.delete_item.await_args_list]
+        assert deletes == [
+            {"item": "p1", "partition_key": "dog"},
+            {"item": "p1", "partition_key": "cat"},
+        ]
+
+
+class TestSearchCache:
+    """Test caching and invalidation of search_pets results"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self, service):
+        """The second identical search skips Cosmos and gets a list of its own"""
+        filters = PetSearchFilters(species="dog")
+
+        first = await service.search_pets(filters)
+        first.clear()
+        second = await service.search_pets(filters)
+
+        assert service._query_pets.call_count == 1
+        assert [pet.id for pet in second] == ["p1"]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_searches(self, service):
+        """Each write through the service makes the next search query Cosmos again"""
+        service.container.patch_item.return_value = {**STORED_PET, "health": 50}
+        writes = [
+            lambda: service.create_pet(PetCreate(
+                name="Milo", species="cat", ageYears=2, health=90, happiness=80, energy=70)),
+            lambda: service.update_pet("p1", PetUpdate(health=50), "dog"),
+            lambda: service.delete_pet("p1", "dog"),
+        ]
+
+        await service.search_pets(PetSearchFilters())
+        for write in writes:
+            await write()
+            await service.search_pets(PetSearchFilters())
+
+        assert service._query_pets.call_count == 1 + len(writes)
+
+
+class TestTTLCache:
+    """Test expiry and eviction of the in-process cache"""
+
+    def test_entries_expire_after_ttl(self):
+        cache = _TTLCache(max_size=4, ttl_seconds=30.0)
+        with patch("database.time.monotonic", return_value=100.0):
+            cache.put("dog", "cached")
+        with patch("database.time.monotonic", return_value=129.0):
+            assert cache.get("dog") == "cached"
+        with patch("database.time.monotonic", return_value=131.0):
+            assert cache.get("dog") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = _TTLCache(max_size=2, ttl_seconds=30.0)
+        cache.put("dog", 1)
+        cache.put("cat", 2)
+        cache.get("dog")
+        cache.put("bird", 3)
+
+        assert cache.get("cat") is None
+        assert cache.get("dog") == 1 and cache.get("bird") == 3
@@ -7,7 +7,7 @@ Run with: python -m pytest test_main.py -v
 import pytest
 from fastapi.testclient import TestClient
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 from main import app
 from models import Pet, PetCreate, PetUpdate
@@ -47,7 +47,7 @@ SAMPLE_PET_RESPONSE = {
 def mock_db_service():
     """Mock database service for testing"""
     with patch('main.get_cosmos_service') as mock_get_service:
-        mock_service = Mock()
+        mock_service = AsyncMock()
         mock_get_service.return_value = mock_service
         yield mock_service
 
@@ -181,7 +181,7 @@ class TestPetSearch:
 
     def test_get_pets_no_filters(self, mock_db_service):
         """Test getting all pets without filters"""
-        mock_pets = [Pet(**SAMPLE_PET_RESPONSE)]
+        mock_pets = [SAMPLE_PET_RESPONSE]
         mock_db_service.search_pets.return_value = mock_pets
         
         response = client.get("/api/pets")
@@ -193,7 +193,7 @@ class TestPetSearch:
 
     def test_get_pets_with_search(self, mock_db_service):
         """Test getting pets with search term"""
-        mock_pets = [Pet(**SAMPLE_PET_RESPONSE)]
+        mock_pets = [SAMPLE_PET_RESPONSE]
         mock_db_service.search_pets.return_value = mock_pets
         
         response = client.get("/api/pets?search=luna")
@@ -206,7 +206,7 @@ class TestPetSearch:
 
     def test_get_pets_with_species_filter(self, mock_db_service):
         """Test getting pets with species filter"""
-        mock_pets = [Pet(**SAMPLE_PET_RESPONSE)]
+        mock_pets = [SAMPLE_PET_RESPONSE]
         mock_db_service.search_pets.return_value = mock_pets
         
         response = client.get("/api/pets?species=dog")
@@ -218,7 +218,7 @@ class TestPetSearch:
 
     def test_get_pets_with_pagination(self, mock_db_service):
         """Test getting pets with pagination"""
-        mock_pets = [Pet(**SAMPLE_PET_RESPONSE)]
+        mock_pets = [SAMPLE_PET_RESPONSE]
         mock_db_service.search_pets.return_value = mock_pets
         
         response = client.get("/api/pets?limit=10&offset=20")
@@ -229,6 +229,26 @@ class TestPetSearch:
         assert call_args.limit == 10
         assert call_args.offset == 20
 
+    def test_get_pets_by_ids(self, mock_db_service):
+        """Test fetching several pets by ID in one call"""
+        mock_db_service.get_pets_by_ids.return_value = [Pet(**SAMPLE_PET_RESPONSE)]
+
+        response = client.get(f"/api/pets?ids={SAMPLE_PET_RESPONSE['id']}, missing")
+        assert response.status_code == 200
+        assert response.json()[0]["id"] == SAMPLE_PET_RESPONSE["id"]
+
+        # IDs are split and trimmed, and the search path is not used
+        mock_db_service.get_pets_by_ids.assert_called_once_with(
+            [SAMPLE_PET_RESPONSE["id"], "missing"])
+        mock_db_service.search_pets.assert_not_called()
+
+    def test_get_pets_by_too_many_ids(self, mock_db_service):
+        """Test rejecting an oversized ID lookup"""
+        ids = ",".join(f"pet{i}" for i in range(101))
+        response = client.get(f"/api/pets?ids={ids}")
+        assert response.status_code == 400
+        mock_db_service.get_pets_by_ids.assert_not_called()
+
     def test_get_pets_invalid_species(self):
         """Test getting pets with invalid species filter"""
         response = client.get("/api/pets?species=invalid")